@@ -1,9 +1,38 @@
 # arctl package initialization
 
-# Export main classes for convenience
-from .core.kernel import ControllerConfig, SystemState, step
-from .core.states import OperationalMode, RawMetrics
-from .engine.synthesizer import ResonanceSynthesizer
+# Export main classes for convenience. Resolved lazily (PEP 562) so `import arctl`
+# stays cheap; each symbol is imported on first attribute access and then cached.
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.kernel import ControllerConfig, SystemState, step
+    from .core.states import OperationalMode, RawMetrics
+    from .engine.synthesizer import ResonanceSynthesizer
+
+_LAZY = {
+    "ControllerConfig": "arctl.core.kernel",
+    "OperationalMode": "arctl.core.states",
+    "RawMetrics": "arctl.core.states",
+    "ResonanceSynthesizer": "arctl.engine.synthesizer",
+    "SystemState": "arctl.core.kernel",
+    "step": "arctl.core.kernel",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
 
 __all__ = [
     "ControllerConfig",
@@ -1,22 +1,63 @@
 """Core ARCTL components: kernel, state machine, chronos"""
 
+from typing import TYPE_CHECKING, Any
+
 from .anchors import blend_anchors, get_anchor
 from .chronos import Chronos, TemporalCoordinateState, TimeLayers, temporal_state_at, time_to_layers
 from .icarus import IcarusConfig, calculate_tunneling_vector
-from .kernel import ControllerConfig, PolicyConfig, SystemState, TimeConfig, get_diagnostics, step
+from .kernel import (
+    ControllerConfig,
+    Diagnostics,
+    PolicyConfig,
+    SystemState,
+    TimeConfig,
+    get_diagnostics,
+    get_diagnostics_tuple,
+    step,
+)
 from .mythos import get_kernel
-from .profiles import get_profile
+from .profiles import get_profile, get_profile_view
 from .states import OperationalMode, RawMetrics, SamplingConfig, TimeState
 
+if TYPE_CHECKING:
+    from .batch import BatchState, SystemStateBuffer, run_trace, step_batch
+
+# The batched kernel pulls in NumPy; resolve it on first access (PEP 562)
+_LAZY = {
+    "BatchState": ".batch",
+    "SystemStateBuffer": ".batch",
+    "run_trace": ".batch",
+    "step_batch": ".batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    obj = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
 __all__ = [
+    "BatchState",
     "Chronos",
     "ControllerConfig",
+    "Diagnostics",
     "IcarusConfig",
     "OperationalMode",
     "PolicyConfig",
     "RawMetrics",
     "SamplingConfig",
     "SystemState",
+    "SystemStateBuffer",
     "TemporalCoordinateState",
     "TimeConfig",
     "TimeLayers",
@@ -25,9 +66,13 @@ __all__ = [
     "calculate_tunneling_vector",
     "get_anchor",
     "get_diagnostics",
+    "get_diagnostics_tuple",
     "get_kernel",
     "get_profile",
+    "get_profile_view",
+    "run_trace",
     "step",
+    "step_batch",
     "temporal_state_at",
     "time_to_layers",
 ]
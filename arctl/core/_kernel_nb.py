@@ -0,0 +1,268 @@
+"""
+Numba Kernel Core
+Flat-scalar mirror of kernel.step() for compiled execution.
+
+_step_core() takes the SystemState fields, the raw metrics and the configuration as plain
+floats/ints (modes and time states as the int codes of arctl.core.batch) and returns a
+flat tuple, so Numba can compile it to native code with no Python objects involved.
+When Numba is not installed the decorator is a no-op and the core runs as plain Python.
+
+Context notes are not produced here; callers needing them use Chronos.sync().
+"""
+
+import math
+from typing import Any, Callable
+
+from .chronos import GAP_THRESHOLD, SYNC_THRESHOLD
+from .icarus import PRESSURE_THRESHOLD_GPA, IcarusConfig
+from .kernel import ControllerConfig
+
+# Optional dependency check
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for numba.njit (supports bare and parameterized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+
+_STANDARD, _EMERGENCY, _COOLDOWN, _FALLBACK = 0, 1, 2, 3
+_SYNC, _LAG, _GAP = 0, 1, 2
+
+
+def flat_config(cfg: ControllerConfig) -> tuple:
+    """Unpack cfg into the trailing scalar arguments of _step_core()."""
+    t, p = cfg.time, cfg.policy
+    return (
+        t.min_step_interval,
+        t.max_step_interval,
+        t.deadlock_timeout,
+        p.max_energy,
+        p.emergency_cost,
+        p.recharge_on_cooldown,
+        p.reset_recovery_amount,
+        p.smoothing_alpha,
+        p.repetition_threshold,
+        p.cooldown_duration,
+        p.temp_standard,
+        p.temp_emergency,
+        p.temp_cooldown,
+        p.temp_fallback,
+        IcarusConfig().stability_index,
+    )
+
+
+@njit(cache=True)
+def _step_core(
+    s_ent: float,
+    s_div: float,
+    s_rep: float,
+    mode: int,
+    energy: int,
+    last_call_time: float,
+    logical_time: float,
+    mode_entry_time: float,
+    pending_dt: float,
+    time_state: int,
+    reset_used: bool,
+    raw_ent: float,
+    raw_div: float,
+    raw_rep: float,
+    now: float,
+    min_iv: float,
+    max_iv: float,
+    deadlock: float,
+    max_e: int,
+    emg_cost: int,
+    recharge: int,
+    reset_amount: int,
+    alpha: float,
+    rep_thr: float,
+    cd_dur: float,
+    t_std: float,
+    t_emg: float,
+    t_cdn: float,
+    t_fbk: float,
+    stability_index: float,
+) -> tuple:
+    """
+    One kernel step over flat scalars.
+
+    Returns:
+        (s_ent, s_div, s_rep, mode, energy, last_call_time, logical_time,
+         mode_entry_time, pending_dt, time_state, reset_used, temperature,
+         step_performed); temperature is NaN when the step was buffered.
+    """
+    if now < last_call_time:
+        now = last_call_time
+    delta = now - last_call_time
+    new_pending = pending_dt + delta
+
+    # 1. Anti-Stutter
+    if new_pending < min_iv:
+        return (
+            s_ent,
+            s_div,
+            s_rep,
+            mode,
+            energy,
+            now,
+            logical_time,
+            mode_entry_time,
+            new_pending,
+            time_state,
+            reset_used,
+            math.nan,
+            False,
+        )
+
+    dt = new_pending if new_pending < max_iv else max_iv
+    remaining_dt = new_pending - dt
+    logical_now = logical_time + dt
+
+    # 2. Chronos Sync
+    if delta < SYNC_THRESHOLD:
+        time_state = _SYNC
+    elif delta < GAP_THRESHOLD:
+        time_state = _LAG
+    else:
+        time_state = _GAP
+
+    # 3. Energy Logic — CONSERVATIVE RESET
+    if mode != _FALLBACK and time_state == _GAP and not reset_used:
+        energy = energy + reset_amount
+        if energy > max_e:
+            energy = max_e
+        reset_used = True
+
+    # 4. Physics Update with Icarus Stability Anchor
+    new_ent = (1.0 - alpha) * s_ent + alpha * raw_ent
+    if mode == _EMERGENCY and new_ent > 0.8:
+        new_ent = new_ent - abs(new_ent - stability_index) * PRESSURE_THRESHOLD_GPA
+        new_ent = 0.0 if new_ent < 0.0 else (1.0 if new_ent > 1.0 else new_ent)
+    new_div = (1.0 - alpha) * s_div + alpha * raw_div
+    new_rep = (1.0 - alpha) * s_rep + alpha * raw_rep
+
+    # 5. Fallback Check — IRREVERSIBLE
+    if mode == _FALLBACK:
+        return (
+            new_ent,
+            new_div,
+            new_rep,
+            _FALLBACK,
+            0,
+            now,
+            logical_now,
+            mode_entry_time,
+            remaining_dt,
+            time_state,
+            reset_used,
+            t_fbk,
+            True,
+        )
+
+    # 6. Mode transitions
+    next_mode = mode
+    time_in_mode = logical_now - mode_entry_time
+    if mode == _EMERGENCY:
+        if time_in_mode > deadlock:
+            next_mode = _COOLDOWN
+            mode_entry_time = logical_now
+    elif mode == _COOLDOWN:
+        if time_in_mode > cd_dur:
+            next_mode = _STANDARD
+            mode_entry_time = logical_now
+            energy = energy + recharge
+            if energy > max_e:
+                energy = max_e
+    elif new_rep > rep_thr:
+        if energy >= emg_cost:
+            next_mode = _EMERGENCY
+            energy -= emg_cost
+        else:
+            next_mode = _FALLBACK
+        mode_entry_time = logical_now
+
+    # 7. Config Selection
+    if next_mode == _STANDARD:
+        temp = t_std
+    elif next_mode == _EMERGENCY:
+        temp = t_emg
+    elif next_mode == _COOLDOWN:
+        temp = t_cdn
+    else:
+        temp = t_fbk
+    if energy > max_e:
+        energy = max_e
+    elif energy < 0:
+        energy = 0
+
+    return (
+        new_ent,
+        new_div,
+        new_rep,
+        next_mode,
+        energy,
+        now,
+        logical_now,
+        mode_entry_time,
+        remaining_dt,
+        time_state,
+        reset_used,
+        temp,
+        True,
+    )
+
+
+@njit(cache=True)
+def _run_trace(
+    raw: Any,
+    times: Any,
+    state: tuple,
+    cfg: tuple,
+    s_ent: Any,
+    s_div: Any,
+    s_rep: Any,
+    mode: Any,
+    energy: Any,
+    last_call_time: Any,
+    logical_time: Any,
+    mode_entry_time: Any,
+    pending_dt: Any,
+    time_state: Any,
+    reset_used: Any,
+    temperature: Any,
+    step_performed: Any,
+) -> None:
+    """
+    Feed one session through len(times) ticks, writing the state after tick i into row i.
+
+    state is the 11-field _step_core() prefix and cfg is flat_config(); raw has shape (N, 3).
+    Under Numba the whole loop runs natively, with one dispatch per trace instead of per tick.
+    """
+    for i in range(times.shape[0]):
+        r = _step_core(*state, raw[i, 0], raw[i, 1], raw[i, 2], times[i], *cfg)
+        s_ent[i] = r[0]
+        s_div[i] = r[1]
+        s_rep[i] = r[2]
+        mode[i] = r[3]
+        energy[i] = r[4]
+        last_call_time[i] = r[5]
+        logical_time[i] = r[6]
+        mode_entry_time[i] = r[7]
+        pending_dt[i] = r[8]
+        time_state[i] = r[9]
+        reset_used[i] = r[10]
+        temperature[i] = r[11]
+        step_performed[i] = r[12]
+        state = (r[0], r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8], r[9], r[10])
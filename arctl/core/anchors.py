@@ -3,6 +3,9 @@ Instructional Anchors v2.0
 Cognitive protocols for latent space steering.
 """
 
+import heapq
+from collections.abc import Mapping
+
 COGNITIVE_MODES = {
     "calm": {
         "name": "Analytical Clarity",
@@ -47,32 +50,34 @@ COGNITIVE_MODES = {
 }
 
 
-def get_anchor(mode: str) -> str:
-    if mode not in COGNITIVE_MODES:
-        return ""
+# Anchor blocks are rendered once at import; COGNITIVE_MODES is treated as constant.
+_ANCHOR_CACHE = {
+    mode: f"[COGNITIVE MODE: {config['name']}]\n"
+    + "\n".join(f"• {instr}" for instr in config["instructions"])
+    for mode, config in COGNITIVE_MODES.items()
+}
+
 
-    config = COGNITIVE_MODES[mode]
-    instructions = "\n".join(f"• {instr}" for instr in config["instructions"])
-    return f"[COGNITIVE MODE: {config['name']}]\n{instructions}"
+def get_anchor(mode: str) -> str:
+    return _ANCHOR_CACHE.get(mode, "")
 
 
-def blend_anchors(mode_weights: dict[str, float], max_modes: int = 3) -> str:
+def blend_anchors(mode_weights: Mapping[str, float], max_modes: int = 3) -> str:
     """
     Creates a composite system prompt based on weighted modes.
     """
-    sorted_modes = sorted(
-        [(mode, weight) for mode, weight in mode_weights.items() if weight > 0.1],
+    selected_modes = heapq.nlargest(
+        max_modes,
+        ((mode, weight) for mode, weight in mode_weights.items() if weight > 0.1),
         key=lambda x: x[1],
-        reverse=True,
     )
-    selected_modes = sorted_modes[:max_modes]
 
     if not selected_modes:
         return ""
 
     combined_parts = []
     for mode, _ in selected_modes:
-        anchor = get_anchor(mode)
+        anchor = _ANCHOR_CACHE.get(mode)
         if anchor:
             combined_parts.append(anchor)
 
@@ -0,0 +1,350 @@
+"""
+Batched Kernel
+Struct-of-Arrays (SoA) form of the ARCTL kernel for serving many concurrent sessions.
+
+Every SystemState field becomes one contiguous NumPy column, and step_batch() advances
+all N sessions by one tick with vectorized ufuncs. Semantics mirror kernel.step()
+element-wise: anti-stutter buffering, conservative reset, Icarus tunneling in EMERGENCY,
+terminal FALLBACK and the energy clamp.
+
+Modes and time states are stored as int8 codes (see MODE_CODES / TIME_STATE_CODES).
+Context notes are not materialized per session; use Chronos.sync() when a note is needed.
+
+Usage:
+    from arctl.core.batch import BatchState, step_batch
+
+    batch = BatchState.initial(n=256, now=0.0)
+    raw = np.column_stack([entropy, divergence, repetition])  # shape (N, 3)
+    batch = step_batch(raw, batch, now, cfg)
+
+    # One session replayed over a whole trace (row i = state after tick i)
+    trace = run_trace(raw_trace, times, SystemState.initial(0.0), cfg)  # raw_trace: (T, 3)
+
+    # Live session log kept as columns; analytics run on the arrays
+    log = SystemStateBuffer()
+    log.append(state)
+    np.bincount(log.columns().mode, minlength=4)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+import numpy as np
+
+from ._kernel_nb import _run_trace, flat_config
+from .chronos import GAP_THRESHOLD, SYNC_THRESHOLD
+from .icarus import PRESSURE_THRESHOLD_GPA, IcarusConfig
+from .kernel import ControllerConfig, SystemState
+from .states import OperationalMode, SamplingConfig, TimeState
+
+# --- ENCODING ---
+
+STANDARD, EMERGENCY, COOLDOWN, FALLBACK = 0, 1, 2, 3
+MODE_CODES = (
+    OperationalMode.STANDARD,
+    OperationalMode.EMERGENCY,
+    OperationalMode.COOLDOWN,
+    OperationalMode.FALLBACK,
+)
+TIME_STATE_CODES = (TimeState.SYNC, TimeState.LAG, TimeState.GAP)
+
+_MODE_INDEX = {mode: i for i, mode in enumerate(MODE_CODES)}
+_TIME_STATE_INDEX = {ts: i for i, ts in enumerate(TIME_STATE_CODES)}
+
+# Only a handful of temperatures exist per policy; unpacked rows share one config each
+_sampling_config = lru_cache(maxsize=256)(SamplingConfig)
+
+
+@dataclass
+class BatchState:
+    """SoA container: column i of every array describes session i."""
+
+    s_entropy: np.ndarray
+    s_divergence: np.ndarray
+    s_repetition: np.ndarray
+    mode: np.ndarray  # int8, index into MODE_CODES
+    energy: np.ndarray
+    last_call_time: np.ndarray
+    logical_time: np.ndarray
+    mode_entry_time: np.ndarray
+    pending_dt: np.ndarray
+    time_state: np.ndarray  # int8, index into TIME_STATE_CODES
+    reset_used: np.ndarray
+    temperature: np.ndarray  # NaN where the step was buffered (active_config is None)
+    step_performed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.mode)
+
+    @staticmethod
+    def initial(n: int, now: float) -> BatchState:
+        return BatchState.from_states([SystemState.initial(now)] * n)
+
+    @staticmethod
+    def from_states(states: Sequence[SystemState]) -> BatchState:
+        """Pack scalar states into columns (context notes are dropped)."""
+        return BatchState(
+            s_entropy=np.array([s.s_entropy for s in states], dtype=np.float64),
+            s_divergence=np.array([s.s_divergence for s in states], dtype=np.float64),
+            s_repetition=np.array([s.s_repetition for s in states], dtype=np.float64),
+            mode=np.array([_MODE_INDEX[s.mode] for s in states], dtype=np.int8),
+            energy=np.array([s.energy for s in states], dtype=np.int32),
+            last_call_time=np.array([s.last_call_time for s in states], dtype=np.float64),
+            logical_time=np.array([s.logical_time for s in states], dtype=np.float64),
+            mode_entry_time=np.array([s.mode_entry_time for s in states], dtype=np.float64),
+            pending_dt=np.array([s.pending_dt for s in states], dtype=np.float64),
+            time_state=np.array([_TIME_STATE_INDEX[s.time_state] for s in states], dtype=np.int8),
+            reset_used=np.array([s.reset_used for s in states], dtype=bool),
+            temperature=np.array(
+                [s.active_config.temperature if s.active_config else np.nan for s in states],
+                dtype=np.float64,
+            ),
+            step_performed=np.array([s.step_performed for s in states], dtype=bool),
+        )
+
+    def state_at(self, i: int) -> SystemState:
+        """Unpack session i into a scalar SystemState (context_note is empty)."""
+        temp = float(self.temperature[i])
+        return SystemState(
+            float(self.s_entropy[i]),
+            float(self.s_divergence[i]),
+            float(self.s_repetition[i]),
+            MODE_CODES[self.mode[i]],
+            int(self.energy[i]),
+            float(self.last_call_time[i]),
+            float(self.logical_time[i]),
+            float(self.mode_entry_time[i]),
+            float(self.pending_dt[i]),
+            TIME_STATE_CODES[self.time_state[i]],
+            "",
+            bool(self.reset_used[i]),
+            None if np.isnan(temp) else _sampling_config(temp),
+            bool(self.step_performed[i]),
+        )
+
+
+class SystemStateBuffer:
+    """
+    Append-only columnar log of one session's SystemStates (context notes are dropped).
+
+    Rows are written straight into preallocated BatchState columns, growing by doubling,
+    so a long history costs a few dozen bytes per row instead of one NamedTuple each.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._data = BatchState.initial(max(capacity, 1), 0.0)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, state: SystemState) -> None:
+        i = self._n
+        data = self._data
+        if i == len(data):
+            for f in fields(BatchState):
+                column = getattr(data, f.name)
+                setattr(data, f.name, np.concatenate([column, np.empty_like(column)]))
+        config = state.active_config
+        data.s_entropy[i] = state.s_entropy
+        data.s_divergence[i] = state.s_divergence
+        data.s_repetition[i] = state.s_repetition
+        data.mode[i] = _MODE_INDEX[state.mode]
+        data.energy[i] = state.energy
+        data.last_call_time[i] = state.last_call_time
+        data.logical_time[i] = state.logical_time
+        data.mode_entry_time[i] = state.mode_entry_time
+        data.pending_dt[i] = state.pending_dt
+        data.time_state[i] = _TIME_STATE_INDEX[state.time_state]
+        data.reset_used[i] = state.reset_used
+        data.temperature[i] = np.nan if config is None else config.temperature
+        data.step_performed[i] = state.step_performed
+        self._n = i + 1
+
+    def columns(self) -> BatchState:
+        """Views of the filled rows (no copy); invalidated by a later append that grows."""
+        n = self._n
+        return BatchState(**{f.name: getattr(self._data, f.name)[:n] for f in fields(BatchState)})
+
+    def state_at(self, i: int) -> SystemState:
+        if not -self._n <= i < self._n:
+            raise IndexError(f"row {i} out of range for {self._n} states")
+        return self._data.state_at(i % self._n)
+
+
+# --- KERNEL ---
+
+
+def step_batch(
+    raw: np.ndarray,
+    prev: BatchState,
+    absolute_now: float | np.ndarray,
+    cfg: ControllerConfig,
+) -> BatchState:
+    """
+    Vectorized kernel.step() over N sessions.
+
+    Args:
+        raw: Raw metrics, shape (N, 3) with columns (entropy, divergence, repetition)
+        prev: Previous batch state (not modified)
+        absolute_now: Wall-clock time, scalar or shape (N,)
+        cfg: Configuration shared by all sessions
+
+    Returns:
+        New BatchState; row i equals step() applied to session i
+    """
+    raw = np.asarray(raw, dtype=np.float64)
+    tc, pc = cfg.time, cfg.policy
+
+    now = np.maximum(absolute_now, prev.last_call_time)
+    delta_real = now - prev.last_call_time
+    new_pending = prev.pending_dt + delta_real
+
+    # 1. Anti-Stutter: rows below min_step_interval only buffer pending_dt
+    active = new_pending >= tc.min_step_interval
+
+    dt = np.minimum(new_pending, tc.max_step_interval)
+    remaining_dt = new_pending - dt
+    logical_now = prev.logical_time + dt
+
+    # 2. Chronos Sync (0 = SYNC, 1 = LAG, 2 = GAP)
+    time_state = (delta_real >= SYNC_THRESHOLD).astype(np.int8) + (delta_real >= GAP_THRESHOLD)
+
+    # 3. Energy Logic — CONSERVATIVE RESET
+    fallback = prev.mode == FALLBACK
+    reset = ~fallback & (time_state == 2) & ~prev.reset_used
+    energy = np.where(
+        reset, np.minimum(prev.energy + pc.reset_recovery_amount, pc.max_energy), prev.energy
+    )
+    reset_used = prev.reset_used | reset
+
+    # 4. Physics Update with Icarus Stability Anchor (EMERGENCY rows only)
+    a = pc.smoothing_alpha
+    s_ent = (1 - a) * prev.s_entropy + a * raw[:, 0]
+    s_div = (1 - a) * prev.s_divergence + a * raw[:, 1]
+    s_rep = (1 - a) * prev.s_repetition + a * raw[:, 2]
+
+    stability_index = IcarusConfig().stability_index
+    tunneled = s_ent - np.abs(s_ent - stability_index) * PRESSURE_THRESHOLD_GPA
+    np.clip(tunneled, 0.0, 1.0, out=tunneled)
+    s_ent = np.where((prev.mode == EMERGENCY) & (s_ent > 0.8), tunneled, s_ent)
+
+    # 5. Mode transitions (FALLBACK rows match no mask and stay frozen)
+    time_in_mode = logical_now - prev.mode_entry_time
+    emg_exit = (prev.mode == EMERGENCY) & (time_in_mode > tc.deadlock_timeout)
+    cdn_exit = (prev.mode == COOLDOWN) & (time_in_mode > pc.cooldown_duration)
+    triggered = (prev.mode == STANDARD) & (s_rep > pc.repetition_threshold)
+    to_emg = triggered & (energy >= pc.emergency_cost)
+    to_fbk = triggered & ~to_emg
+
+    mode = prev.mode.copy()
+    mode[emg_exit] = COOLDOWN
+    mode[cdn_exit] = STANDARD
+    mode[to_emg] = EMERGENCY
+    mode[to_fbk] = FALLBACK
+
+    energy = np.where(cdn_exit, np.minimum(pc.max_energy, energy + pc.recharge_on_cooldown), energy)
+    energy = np.where(to_emg, energy - pc.emergency_cost, energy)
+    np.clip(energy, 0, pc.max_energy, out=energy)
+    energy[fallback] = 0
+
+    transitioned = emg_exit | cdn_exit | triggered
+    mode_entry_time = np.where(transitioned, logical_now, prev.mode_entry_time)
+
+    # 6. Config Selection: 4-entry lookup indexed by mode code
+    temp_table = np.array([pc.temp_standard, pc.temp_emergency, pc.temp_cooldown, pc.temp_fallback])
+    temperature = temp_table[mode]
+
+    # 7. Merge: buffered rows keep prev except for the clock and pending_dt
+    return BatchState(
+        s_entropy=np.where(active, s_ent, prev.s_entropy),
+        s_divergence=np.where(active, s_div, prev.s_divergence),
+        s_repetition=np.where(active, s_rep, prev.s_repetition),
+        mode=np.where(active, mode, prev.mode).astype(np.int8),
+        energy=np.where(active, energy, prev.energy).astype(np.int32),
+        last_call_time=np.broadcast_to(now, prev.last_call_time.shape).astype(np.float64),
+        logical_time=np.where(active, logical_now, prev.logical_time),
+        mode_entry_time=np.where(active, mode_entry_time, prev.mode_entry_time),
+        pending_dt=np.where(active, remaining_dt, new_pending),
+        time_state=np.where(active, time_state, prev.time_state).astype(np.int8),
+        reset_used=np.where(active, reset_used, prev.reset_used),
+        temperature=np.where(active, temperature, np.nan),
+        step_performed=active,
+    )
+
+
+def run_trace(
+    raw: np.ndarray, times: np.ndarray, state0: SystemState, cfg: ControllerConfig
+) -> BatchState:
+    """
+    Replay one session through a recorded trace of T ticks.
+
+    Transitions depend on the previous tick, so this is a sequential scan; it runs as a
+    single Numba-compiled loop when Numba is installed (pure Python otherwise).
+
+    Args:
+        raw: Raw metrics per tick, shape (T, 3) with columns (entropy, divergence, repetition)
+        times: Wall-clock time per tick, shape (T,)
+        state0: State before the first tick
+        cfg: Configuration
+
+    Returns:
+        BatchState of length T; row i equals the state after tick i (context notes dropped)
+    """
+    raw = np.ascontiguousarray(raw, dtype=np.float64)
+    times = np.ascontiguousarray(times, dtype=np.float64)
+    n = len(times)
+    if raw.shape != (n, 3):
+        raise ValueError(f"raw must have shape ({n}, 3), got {raw.shape}")
+
+    out = BatchState(
+        s_entropy=np.empty(n),
+        s_divergence=np.empty(n),
+        s_repetition=np.empty(n),
+        mode=np.empty(n, dtype=np.int8),
+        energy=np.empty(n, dtype=np.int32),
+        last_call_time=np.empty(n),
+        logical_time=np.empty(n),
+        mode_entry_time=np.empty(n),
+        pending_dt=np.empty(n),
+        time_state=np.empty(n, dtype=np.int8),
+        reset_used=np.empty(n, dtype=bool),
+        temperature=np.empty(n),
+        step_performed=np.empty(n, dtype=bool),
+    )
+    core = (
+        float(state0.s_entropy),
+        float(state0.s_divergence),
+        float(state0.s_repetition),
+        _MODE_INDEX[state0.mode],
+        int(state0.energy),
+        float(state0.last_call_time),
+        float(state0.logical_time),
+        float(state0.mode_entry_time),
+        float(state0.pending_dt),
+        _TIME_STATE_INDEX[state0.time_state],
+        bool(state0.reset_used),
+    )
+    _run_trace(
+        raw,
+        times,
+        core,
+        flat_config(cfg),
+        out.s_entropy,
+        out.s_divergence,
+        out.s_repetition,
+        out.mode,
+        out.energy,
+        out.last_call_time,
+        out.logical_time,
+        out.mode_entry_time,
+        out.pending_dt,
+        out.time_state,
+        out.reset_used,
+        out.temperature,
+        out.step_performed,
+    )
+    return out
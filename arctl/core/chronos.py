@@ -18,9 +18,11 @@ Usage:
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 
 from .states import TimeState
 
@@ -90,12 +92,12 @@ def temporal_state_at(coordinate: float, cursor: float) -> TemporalCoordinateSta
     return TemporalCoordinateState.PROBABILISTIC_FIELD
 
 
+_STATE_TABLE = (TimeState.SYNC, TimeState.LAG, TimeState.GAP)
+
+
 def _gap_state(delta: float) -> TimeState:
-    if delta < SYNC_THRESHOLD:
-        return TimeState.SYNC
-    if delta < GAP_THRESHOLD:
-        return TimeState.LAG
-    return TimeState.GAP
+    # Branchless: two comparisons index the table (NaN falls through to GAP, as before)
+    return _STATE_TABLE[2 - (delta < GAP_THRESHOLD) - (delta < SYNC_THRESHOLD)]
 
 
 def _format_duration_ago(delta: float) -> str:
@@ -108,6 +110,18 @@ def _format_duration_ago(delta: float) -> str:
     return f"{int(delta / 86400)} days ago"
 
 
+@lru_cache(maxsize=4096)
+def _minute_stamps(minute: int) -> tuple[str, str]:
+    """Memoized (strftime date, layers prefix) for a UTC minute index; ~3 days of minutes."""
+    ts = minute * 60
+    layers = time_to_layers(ts)
+    return (
+        datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M"),
+        f"{layers.years}-{layers.months:02d}-{layers.days:02d} "
+        f"{layers.hours:02d}:{layers.minutes:02d}",
+    )
+
+
 class Chronos:
     """Temporal sync: classifies gaps (SYNC/LAG/GAP) and builds context notes using 8-layer time."""
 
@@ -123,19 +137,27 @@ class Chronos:
         if state == TimeState.SYNC:
             return state, ""
 
-        cursor_layers = time_to_layers(current_ts)
-        current_date = datetime.fromtimestamp(current_ts, tz=timezone.utc).strftime(
-            "%Y-%m-%d %H:%M"
-        )
+        # Only seconds/milliseconds change within a minute; the date formatting is cached.
+        # Whole seconds follow datetime's round-half-even to microseconds.
+        whole = math.floor(current_ts)
+        if round((current_ts - whole) * 1e6) >= 1_000_000:
+            whole += 1
+        minute, second = divmod(int(whole), 60)
+        current_date, layers_minute = _minute_stamps(minute)
+        millis = int((current_ts % 1) * 1000)
         ago = _format_duration_ago(delta)
 
         note = (
             f"[SYSTEM]: TEMPORAL SYNC.\n"
             f"Previous: {ago}.\n"
             f"CURSOR (NOW): {current_date} UTC | "
-            f"layers={cursor_layers.years}-{cursor_layers.months:02d}-{cursor_layers.days:02d} "
-            f"{cursor_layers.hours:02d}:{cursor_layers.minutes:02d}:{cursor_layers.seconds:02d}.{cursor_layers.milliseconds:03d}\n"
+            f"layers={layers_minute}:{second:02d}.{millis:03d}\n"
             f"STATE: t<=NOW -> FROZEN_STATE [READ_ONLY]; t>NOW -> PROBABILISTIC_FIELD [READ_WRITE].\n"
             f"Treat events before {current_date} as PAST or PRESENT."
         )
         return state, note
+
+    @staticmethod
+    def _sync_fast(delta: float) -> TimeState:
+        """Classify a gap of delta seconds without building the context note."""
+        return _gap_state(delta)
@@ -34,10 +34,16 @@ Philosophy:
     "No hidden state. No infinite loops. No recovery without cost. Failure is explicit."
 """
 
-from dataclasses import dataclass, field
+import math
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from typing import NamedTuple, Optional
 
-from .chronos import Chronos
+from .chronos import SYNC_THRESHOLD, Chronos
+from .icarus import IcarusConfig, calculate_tunneling_vector
 from .states import OperationalMode, RawMetrics, SamplingConfig, TimeState
 
 # --- CONFIGURATION ---
@@ -50,6 +56,19 @@ class TimeConfig:
     deadlock_timeout: float = 5.0
 
 
+@lru_cache(maxsize=128)
+def _sampling_table(
+    t_std: float, t_emg: float, t_cdn: float, t_fbk: float
+) -> dict[OperationalMode, SamplingConfig]:
+    """One interned SamplingConfig per mode; policies with equal temperatures share it."""
+    return {
+        OperationalMode.STANDARD: SamplingConfig(t_std),
+        OperationalMode.EMERGENCY: SamplingConfig(t_emg),
+        OperationalMode.COOLDOWN: SamplingConfig(t_cdn),
+        OperationalMode.FALLBACK: SamplingConfig(t_fbk),
+    }
+
+
 @dataclass(frozen=True)
 class PolicyConfig:
     max_energy: int = 10
@@ -65,16 +84,85 @@ class PolicyConfig:
     temp_cooldown: float = 0.5
     temp_fallback: float = 0.1
 
+    @property
+    def sampling_by_mode(self) -> Mapping[OperationalMode, SamplingConfig]:
+        """Read-only view of the interned per-mode SamplingConfig table."""
+        return MappingProxyType(
+            _sampling_table(
+                self.temp_standard, self.temp_emergency, self.temp_cooldown, self.temp_fallback
+            )
+        )
+
+
+# Shared defaults: both configs are frozen, so one instance is safe to share
+_DEFAULT_TIME = TimeConfig()
+_DEFAULT_POLICY = PolicyConfig()
+
+
+class _FlatConfig(NamedTuple):
+    """ControllerConfig scalars in step() order, unpacked once per call."""
+
+    min_iv: float
+    max_iv: float
+    deadlock: float
+    max_e: int
+    emg_cost: int
+    recharge: int
+    reset_amount: int
+    alpha: float
+    rep_thr: float
+    cd_dur: float
+    sampling: dict[OperationalMode, SamplingConfig]
+
+
+def _flatten(t: TimeConfig, p: PolicyConfig) -> _FlatConfig:
+    """Flatten the two sub-configs into the scalars step() reads."""
+    return _FlatConfig(
+        t.min_step_interval,
+        t.max_step_interval,
+        t.deadlock_timeout,
+        p.max_energy,
+        p.emergency_cost,
+        p.recharge_on_cooldown,
+        p.reset_recovery_amount,
+        p.smoothing_alpha,
+        p.repetition_threshold,
+        p.cooldown_duration,
+        _sampling_table(p.temp_standard, p.temp_emergency, p.temp_cooldown, p.temp_fallback),
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_flat() -> _FlatConfig:
+    # ControllerConfig() with default sub-configs always flattens to the same values
+    return _flatten(_DEFAULT_TIME, _DEFAULT_POLICY)
+
 
 @dataclass(frozen=True)
 class ControllerConfig:
-    time: TimeConfig = field(default_factory=TimeConfig)
-    policy: PolicyConfig = field(default_factory=PolicyConfig)
+    time: TimeConfig = _DEFAULT_TIME
+    policy: PolicyConfig = _DEFAULT_POLICY
+
+    @cached_property
+    def _flat(self) -> _FlatConfig:
+        """Flattened scalars for step(), derived on first use; not a dataclass field."""
+        # Both sub-configs are frozen, so the cached tuple never goes stale
+        if self.time is _DEFAULT_TIME and self.policy is _DEFAULT_POLICY:
+            return _default_flat()
+        return _flatten(self.time, self.policy)
 
 
 # --- STATE ---
 
-_FALLBACK_CONFIG = SamplingConfig(0.1)
+_INITIAL_CONFIG = SamplingConfig(0.7)  # shared by every SystemState.initial()
+
+# Binary layout: 9 doubles (metrics, clocks, temperature, top_p; NaN encodes None),
+# energy, then mode / time state codes and the two flags; context_note trails as UTF-8.
+_STATE_STRUCT = struct.Struct("<9di4B")
+_MODES = tuple(OperationalMode)
+_TIME_STATES = tuple(TimeState)
+_MODE_CODE = {m: i for i, m in enumerate(_MODES)}
+_TIME_STATE_CODE = {t: i for i, t in enumerate(_TIME_STATES)}
 
 
 class SystemState(NamedTuple):
@@ -113,13 +201,87 @@ class SystemState(NamedTuple):
             TimeState.SYNC,
             "",
             False,  # reset_used starts as False
-            SamplingConfig(0.7),
+            _INITIAL_CONFIG,
             True,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact fixed header plus the UTF-8 context note."""
+        cfg = self.active_config
+        if cfg is None:
+            temp = top_p = math.nan
+        else:
+            temp = cfg.temperature
+            top_p = math.nan if cfg.top_p is None else cfg.top_p
+        header = _STATE_STRUCT.pack(
+            self.s_entropy,
+            self.s_divergence,
+            self.s_repetition,
+            self.last_call_time,
+            self.logical_time,
+            self.mode_entry_time,
+            self.pending_dt,
+            temp,
+            top_p,
+            self.energy,
+            _MODE_CODE[self.mode],
+            _TIME_STATE_CODE[self.time_state],
+            self.reset_used,
+            self.step_performed,
+        )
+        return header + self.context_note.encode()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "SystemState":
+        """Inverse of to_bytes(); accepts any bytes-like object (e.g. a memoryview)."""
+        (
+            s_ent,
+            s_div,
+            s_rep,
+            last_call_time,
+            logical_time,
+            mode_entry_time,
+            pending_dt,
+            temp,
+            top_p,
+            energy,
+            mode,
+            time_state,
+            reset_used,
+            step_performed,
+        ) = _STATE_STRUCT.unpack_from(data)
+        return SystemState(
+            s_ent,
+            s_div,
+            s_rep,
+            _MODES[mode],
+            energy,
+            last_call_time,
+            logical_time,
+            mode_entry_time,
+            pending_dt,
+            _TIME_STATES[time_state],
+            bytes(data[_STATE_STRUCT.size :]).decode(),
+            bool(reset_used),
+            None
+            if math.isnan(temp)
+            else SamplingConfig(temp, None if math.isnan(top_p) else top_p),
+            bool(step_performed),
+        )
+
 
 # --- KERNEL ---
 
+# Module-level aliases: one global load instead of global + attribute per comparison
+_STD = OperationalMode.STANDARD
+_EMG = OperationalMode.EMERGENCY
+_CDN = OperationalMode.COOLDOWN
+_FBK = OperationalMode.FALLBACK
+_SYNC = TimeState.SYNC
+_GAP = TimeState.GAP
+
+_ICARUS = IcarusConfig()  # frozen; one shared anchor instead of one per step
+
 
 def step(
     raw: RawMetrics, prev: SystemState, absolute_now: float, cfg: ControllerConfig
@@ -151,109 +313,148 @@ def step(
         - Logical time advances only when a control step executes
         - Anti-stutter accumulates pending_dt until min_step_interval is reached
     """
-    absolute_now = max(absolute_now, prev.last_call_time)
-    delta_real = absolute_now - prev.last_call_time
-    new_pending = prev.pending_dt + delta_real
+    # Config scalars come from the cached flat tuple: one unpack instead of attribute chains
+    (
+        min_iv,
+        max_iv,
+        deadlock,
+        max_e,
+        emg_cost,
+        recharge,
+        reset_amount,
+        a,
+        rep_thr,
+        cd_dur,
+        sampling,
+    ) = cfg._flat
+    # One UNPACK_SEQUENCE instead of a descriptor lookup per field access
+    (
+        s_entropy,
+        s_divergence,
+        s_repetition,
+        mode,
+        energy,
+        last_call_time,
+        logical_time,
+        mode_entry_time,
+        pending_dt,
+        time_state,
+        context_note,
+        reset_used,
+        _,
+        _,
+    ) = prev
+    # Clamps below are inline conditionals: builtin min()/max() cost a generic call each.
+    if absolute_now < last_call_time:
+        absolute_now = last_call_time
+    delta_real = absolute_now - last_call_time
+    new_pending = pending_dt + delta_real
 
     # 1. Anti-Stutter
-    if new_pending < cfg.time.min_step_interval:
-        return prev._replace(
-            last_call_time=absolute_now,
-            pending_dt=new_pending,
-            step_performed=False,
-            active_config=None,
+    # Hot path at high call rates: build the buffered state positionally instead of via
+    # _replace (no kwargs dict, no field validation). prev itself is never mutated.
+    if new_pending < min_iv:
+        return SystemState(
+            s_entropy,
+            s_divergence,
+            s_repetition,
+            mode,
+            energy,
+            absolute_now,
+            logical_time,
+            mode_entry_time,
+            new_pending,
+            time_state,
+            context_note,
+            reset_used,
+            None,
+            False,
         )
 
-    dt = min(new_pending, cfg.time.max_step_interval)
+    dt = max_iv if new_pending > max_iv else new_pending
     remaining_dt = new_pending - dt
-    effective_logical_now = prev.logical_time + dt
+    effective_logical_now = logical_time + dt
 
-    # 2. Chronos Sync
-    time_state, context_note = Chronos.sync(prev.last_call_time, absolute_now)
+    # 2. Chronos Sync (SYNC carries no note, so only LAG/GAP pay for formatting)
+    if delta_real < SYNC_THRESHOLD:
+        time_state, context_note = _SYNC, ""
+    else:
+        time_state, context_note = Chronos.sync(last_call_time, absolute_now)
 
     # 3. Energy Logic — CONSERVATIVE RESET
-    next_energy = prev.energy
-    new_reset_used = prev.reset_used
+    next_energy = energy
+    new_reset_used = reset_used
 
     # Only update reset flag if not in FALLBACK state
-    if (
-        prev.mode != OperationalMode.FALLBACK
-        and time_state == TimeState.GAP
-        and not prev.reset_used
-    ):
-        next_energy = min(prev.energy + cfg.policy.reset_recovery_amount, cfg.policy.max_energy)
+    if mode is not _FBK and time_state is _GAP and not reset_used:
+        next_energy = energy + reset_amount
+        if next_energy > max_e:
+            next_energy = max_e
         new_reset_used = True
 
     # 4. Physics Update with Icarus Stability Anchor
-    a = cfg.policy.smoothing_alpha
-    raw_entropy_smoothed = (1 - a) * prev.s_entropy + a * raw.entropy
+    raw_entropy_smoothed = (1 - a) * s_entropy + a * raw.entropy
 
     # Apply Icarus ONLY in active modes (STANDARD, EMERGENCY)
-    from .icarus import IcarusConfig, calculate_tunneling_vector
-
-    icarus_cfg = IcarusConfig()
-
-    if prev.mode == OperationalMode.EMERGENCY:
-        s_ent = calculate_tunneling_vector(raw_entropy_smoothed, icarus_cfg)
+    if mode is _EMG:
+        s_ent = calculate_tunneling_vector(raw_entropy_smoothed, _ICARUS)
     else:
         # In COOLDOWN / FALLBACK: use raw physics (no tunneling)
         s_ent = raw_entropy_smoothed
 
-    s_div = (1 - a) * prev.s_divergence + a * raw.divergence
-    s_rep = (1 - a) * prev.s_repetition + a * raw.repetition
+    s_div = (1 - a) * s_divergence + a * raw.divergence
+    s_rep = (1 - a) * s_repetition + a * raw.repetition
 
     # 5. Fallback Check — IRREVERSIBLE (mode frozen, but metrics update)
-    if prev.mode == OperationalMode.FALLBACK:
+    if mode is _FBK:
         return SystemState(
             s_ent,
             s_div,
             s_rep,
-            OperationalMode.FALLBACK,
+            _FBK,
             0,  # Energy frozen at 0 in FALLBACK
             absolute_now,
             effective_logical_now,
-            prev.mode_entry_time,  # Mode entry time frozen
+            mode_entry_time,  # Mode entry time frozen
             remaining_dt,
             time_state,
             context_note,
             new_reset_used,
-            _FALLBACK_CONFIG,
+            sampling[_FBK],  # policy's temp_fallback, as on the transition path
             True,
         )
 
-    next_mode: OperationalMode = prev.mode
-    next_mode_time = prev.mode_entry_time
-    time_in_mode = effective_logical_now - prev.mode_entry_time
+    next_mode: OperationalMode = mode
+    next_mode_time = mode_entry_time
+    time_in_mode = effective_logical_now - mode_entry_time
 
-    if prev.mode == OperationalMode.EMERGENCY:
-        if time_in_mode > cfg.time.deadlock_timeout:
-            next_mode = OperationalMode.COOLDOWN
+    if mode is _EMG:
+        if time_in_mode > deadlock:
+            next_mode = _CDN
             next_mode_time = effective_logical_now
-    elif prev.mode == OperationalMode.COOLDOWN:
-        if time_in_mode > cfg.policy.cooldown_duration:
-            next_mode = OperationalMode.STANDARD
+    elif mode is _CDN:
+        if time_in_mode > cd_dur:
+            next_mode = _STD
             next_mode_time = effective_logical_now
-            next_energy = min(cfg.policy.max_energy, next_energy + cfg.policy.recharge_on_cooldown)
+            next_energy += recharge
+            if next_energy > max_e:
+                next_energy = max_e
     else:
-        if s_rep > cfg.policy.repetition_threshold:
-            if next_energy >= cfg.policy.emergency_cost:
-                next_mode = OperationalMode.EMERGENCY
-                next_energy -= cfg.policy.emergency_cost
+        if s_rep > rep_thr:
+            if next_energy >= emg_cost:
+                next_mode = _EMG
+                next_energy -= emg_cost
                 next_mode_time = effective_logical_now
             else:
-                next_mode = OperationalMode.FALLBACK
+                next_mode = _FBK
                 next_mode_time = effective_logical_now
 
-    # 6. Mode transitions (above). 7. Config Selection
-    temp_map = {
-        OperationalMode.STANDARD: cfg.policy.temp_standard,
-        OperationalMode.EMERGENCY: cfg.policy.temp_emergency,
-        OperationalMode.COOLDOWN: cfg.policy.temp_cooldown,
-        OperationalMode.FALLBACK: cfg.policy.temp_fallback,
-    }
-    temp = temp_map.get(next_mode, cfg.policy.temp_standard)
-    config = SamplingConfig(temp)
-    next_energy = max(0, min(cfg.policy.max_energy, next_energy))
+    # 6. Mode transitions (above). 7. Config Selection (interned, no allocation)
+    config = sampling[next_mode]
+    if next_energy > max_e:
+        next_energy = max_e
+    elif next_energy < 0:
+        next_energy = 0
 
     return SystemState(
         s_ent,
@@ -287,3 +488,36 @@ def get_diagnostics(state: SystemState, absolute_now: float) -> dict:
         "logical_time": state.logical_time,
         "context_note": state.context_note,
     }
+
+
+class Diagnostics(NamedTuple):
+    """get_diagnostics() fields, in the same order, as one tuple allocation."""
+
+    days_since_last_interaction: float
+    energy_level: int
+    reset_used: bool
+    current_mode: str
+    time_state: str
+    logical_time: float
+    context_note: str
+
+    def as_dict(self) -> dict:
+        """Plain dict equal to get_diagnostics(), for JSON or logging sinks."""
+        return self._asdict()
+
+
+def get_diagnostics_tuple(state: SystemState, absolute_now: float) -> Diagnostics:
+    """
+    Same telemetry as get_diagnostics(), returned as a Diagnostics NamedTuple.
+
+    Opt-in for loops that poll every step; call .as_dict() at a JSON or logging boundary.
+    """
+    return Diagnostics(
+        round((absolute_now - state.last_call_time) / 86400.0, 2),
+        state.energy,
+        state.reset_used,
+        state.mode.value,
+        state.time_state.value,
+        state.logical_time,
+        state.context_note,
+    )
@@ -4,6 +4,9 @@ Multi-phase resonance profiles for different knowledge domains.
 # CALM profile is the low-entropy baseline for truth verification.
 # Icarus stability_index (0.95) anchors the Hard Core; profiles tune the Soft Core.
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 DOMAIN_PROFILES = {
     "technical": {
         "analyze": {"calm": 0.8, "vigilance": 0.2},
@@ -25,13 +28,26 @@ DOMAIN_PROFILES = {
 }
 
 
-def get_profile(domain: str, phase: str = "analyze") -> dict[str, float]:
-    """Return resonance profile (emotion mix) for the given domain and phase."""
-    if domain not in DOMAIN_PROFILES:
-        return {"calm": 0.8, "wonder": 0.2}
+# Read-only views built once; mutations must go through a get_profile() copy
+_DOMAIN_PROFILES_RO = {
+    domain: {phase: MappingProxyType(mix) for phase, mix in phases.items()}
+    for domain, phases in DOMAIN_PROFILES.items()
+}
+_DEFAULT_PROFILE = MappingProxyType({"calm": 0.8, "wonder": 0.2})
+
 
-    domain_profiles = DOMAIN_PROFILES[domain]
-    if phase not in domain_profiles:
-        phase = next(iter(domain_profiles))
+def get_profile_view(domain: str, phase: str = "analyze") -> Mapping[str, float]:
+    """Read-only resonance profile for the given domain and phase (no copy)."""
+    domain_profiles = _DOMAIN_PROFILES_RO.get(domain)
+    if domain_profiles is None:
+        return _DEFAULT_PROFILE
 
-    return domain_profiles[phase].copy()
+    profile = domain_profiles.get(phase)
+    if profile is None:
+        profile = next(iter(domain_profiles.values()))
+    return profile
+
+
+def get_profile(domain: str, phase: str = "analyze") -> dict[str, float]:
+    """Return resonance profile (emotion mix) for the given domain and phase."""
+    return dict(get_profile_view(domain, phase))
@@ -2,14 +2,24 @@
 Resonance Synthesizer with Multi-Pass Generation capability.
 """
 
-from typing import Any, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Protocol
 
 from arctl.core.anchors import blend_anchors
 from arctl.core.profiles import get_profile
 
+# Single-mode anchors used by multi_synthesize(); inputs are constant, so render once
+_MULTI_MODES = ("calm", "joy", "vigilance", "wonder")
+_SINGLE_MODE_ANCHORS = {mode: blend_anchors({mode: 1.0}) for mode in _MULTI_MODES}
+
 
 class ModelInterface(Protocol):
-    """Protocol that any LLM wrapper must implement."""
+    """
+    Protocol that any LLM wrapper must implement.
+
+    No thread safety is assumed: generate() is only called concurrently when the caller
+    opts in via multi_synthesize(max_workers > 1).
+    """
 
     def generate(self, prompt: str) -> str: ...
 
@@ -30,18 +40,28 @@ class ResonanceSynthesizer:
 
         return {"response": primary_response, "profile": profile, "anchor_used": bool(anchor)}
 
-    def multi_synthesize(self, prompt: str, domain: str, phase: str = "analyze") -> dict[str, Any]:
+    def multi_synthesize(
+        self, prompt: str, domain: str, phase: str = "analyze", max_workers: Optional[int] = None
+    ) -> dict[str, Any]:
         """
         Multi-pass generation for high-fidelity resonance verification.
         Requires more compute.
+
+        The per-mode generations are independent. They run serially by default (None or 1),
+        since ModelInterface makes no thread-safety promise; pass max_workers > 1 to run
+        them concurrently on a thread pool when the model can be called from several threads.
         """
-        modes_to_test = ["calm", "joy", "vigilance", "wonder"]
-        responses = {}
-
-        for mode in modes_to_test:
-            single_profile = {mode: 1.0}
-            anchor = blend_anchors(single_profile)
-            test_prompt = f"{anchor}\n\nUSER QUERY:\n{prompt}" if anchor else prompt
-            responses[mode] = self.model.generate(test_prompt)
+        prompts = {}
+
+        for mode, anchor in _SINGLE_MODE_ANCHORS.items():
+            prompts[mode] = f"{anchor}\n\nUSER QUERY:\n{prompt}" if anchor else prompt
+
+        workers = 1 if max_workers is None else max_workers
+        if workers <= 1:
+            responses = {mode: self.model.generate(p) for mode, p in prompts.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {mode: pool.submit(self.model.generate, p) for mode, p in prompts.items()}
+                responses = {mode: future.result() for mode, future in futures.items()}
 
         return {"responses": responses, "domain": domain, "phase": phase}
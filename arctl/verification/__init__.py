@@ -1,9 +1,33 @@
 """Verification and metrics components: lexical analysis, resonance verification, uncertainty scoring"""
 
+from typing import TYPE_CHECKING, Any
+
 from .lexical import LexicalMetrics
-from .metrics import ResonanceVerifier
 from .uncertainty import UncertaintyScorer
 
+if TYPE_CHECKING:
+    from .metrics import ResonanceVerifier
+
+# The resonance verifier pulls in NumPy (and sentence_transformers when used); resolve it on
+# first access (PEP 562)
+_LAZY = {"ResonanceVerifier": ".metrics"}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    obj = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
 __all__ = [
     "LexicalMetrics",
     "ResonanceVerifier",
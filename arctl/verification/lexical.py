@@ -15,16 +15,15 @@ class LexicalMetrics:
         recent = history_tokens[-window:]
 
         # 1. Repetition (N-gram overlap)
+        # Trigrams are zipped from offset views straight into the set: no per-window slice
+        # and no intermediate list.
         ngram_size = 3
         if len(recent) < ngram_size:
             rep_score = 0.0
         else:
-            ngrams = [
-                tuple(recent[i : i + ngram_size]) for i in range(len(recent) - ngram_size + 1)
-            ]
-            unique = len(set(ngrams))
-            total = len(ngrams)
-            rep_score = 1.0 - (unique / total) if total > 0 else 0.0
+            unique = len(set(zip(recent, recent[1:], recent[2:])))
+            total = len(recent) - ngram_size + 1
+            rep_score = 1.0 - (unique / total)
 
         # 2. Entropy Proxy (Vocabulary Diversity)
         vocab_size = len(set(recent))
@@ -6,36 +6,58 @@ Measures semantic stability (invariance) across different cognitive modes.
 from __future__ import annotations
 
 import re
+from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
 import numpy as np
 
-# Optional dependency check
-try:
-    from sentence_transformers import SentenceTransformer
-
-    HAS_TRANSFORMERS = True
-except ImportError:
-    HAS_TRANSFORMERS = False
+# Optional dependency check; the (torch-backed) import itself waits until a verifier is built
+HAS_TRANSFORMERS = find_spec("sentence_transformers") is not None
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+# Claim boundary: whitespace after "." or "?", skipping abbreviations like "e.g." and "Dr."
+_CLAIM_SPLIT = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s")
+
 
 class ResonanceVerifier:
     embedder: SentenceTransformer | None
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.embedder = None
         if HAS_TRANSFORMERS:
-            self.embedder = SentenceTransformer(model_name)
-        else:
-            self.embedder = None
-            print("[WARNING] sentence_transformers not installed. Verification disabled.")
+            # Installed but possibly broken (e.g. torch ABI mismatch): degrade like a missing one
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                pass
+            else:
+                self.embedder = SentenceTransformer(model_name)
+                return
+        print("[WARNING] sentence_transformers not installed. Verification disabled.")
 
     def _split_into_claims(self, text: str) -> list[str]:
         # Improved regex splitting to handle abbreviations better than simple dot split
-        sentences = re.split(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s", text)
-        return [s.strip() for s in sentences if len(s.strip()) > 10][:3]  # Top 3 substantial claims
+        sentences = _CLAIM_SPLIT.split(text)
+        claims = (s.strip() for s in sentences)
+        return [c for c in claims if len(c) > 10][:3]  # Top 3 substantial claims
+
+    @staticmethod
+    def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Unit-length rows; zero-norm rows stay zero so they score 0.0 against anything."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms >= 1e-10)
+
+    @staticmethod
+    def _normalized_similarity(unit1: np.ndarray, unit2: np.ndarray) -> float:
+        """Mean cosine similarity of two pre-normalized embedding sets (a single GEMM)."""
+        if len(unit1) == 0 or len(unit2) == 0:
+            return 0.0
+        sims = unit1 @ unit2.T
+        # Clamp to [-1, 1] to handle floating point errors
+        np.clip(sims, -1.0, 1.0, out=sims)
+        return float(sims.mean())
 
     def _calculate_pairwise_similarity(
         self, embeddings1: np.ndarray, embeddings2: np.ndarray
@@ -43,22 +65,9 @@ class ResonanceVerifier:
         """Calculate cosine similarity between two sets of embeddings with proper error handling."""
         if len(embeddings1) == 0 or len(embeddings2) == 0:
             return 0.0
-
-        similarities = []
-        for emb1 in embeddings1:
-            for emb2 in embeddings2:
-                norm1 = np.linalg.norm(emb1)
-                norm2 = np.linalg.norm(emb2)
-                # Handle zero-vector case
-                if norm1 < 1e-10 or norm2 < 1e-10:
-                    sim = 0.0
-                else:
-                    sim = float(np.dot(emb1, emb2) / (norm1 * norm2))
-                    # Clamp to [-1, 1] to handle floating point errors
-                    sim = max(-1.0, min(1.0, sim))
-                similarities.append(sim)
-
-        return float(np.mean(similarities)) if similarities else 0.0
+        return self._normalized_similarity(
+            self._l2_normalize(embeddings1), self._l2_normalize(embeddings2)
+        )
 
     def verify(self, responses: dict[str, str]) -> dict[str, float | bool | list[str] | str]:
         """Verify semantic stability across different response modes."""
@@ -73,10 +82,23 @@ class ResonanceVerifier:
         for mode, response in responses.items():
             key_claims[mode] = self._split_into_claims(response)
 
+        # One encode call for every claim of every mode, then slice per mode by offsets.
+        # Rows are normalized once here: each mode takes part in several pairs below.
+        flat_claims = [claim for claims in key_claims.values() for claim in claims]
+        unit = np.empty((0, 0))
+        if flat_claims:
+            unit = self._l2_normalize(
+                self.embedder.encode(
+                    flat_claims, convert_to_numpy=True, batch_size=len(flat_claims)
+                )
+            )
+
         all_embeddings = {}
+        cursor = 0
         for mode, claims in key_claims.items():
             if claims:
-                all_embeddings[mode] = self.embedder.encode(claims, convert_to_numpy=True)
+                all_embeddings[mode] = unit[cursor : cursor + len(claims)]
+                cursor += len(claims)
             else:
                 all_embeddings[mode] = np.array([])
 
@@ -85,7 +107,7 @@ class ResonanceVerifier:
 
         for i in range(len(modes)):
             for j in range(i + 1, len(modes)):
-                sim = self._calculate_pairwise_similarity(
+                sim = self._normalized_similarity(
                     all_embeddings[modes[i]], all_embeddings[modes[j]]
                 )
                 similarities_list.append(sim)
@@ -6,7 +6,14 @@ Detects epistemic insecurity in model outputs.
 from typing import ClassVar
 
 
+def _by_weight(markers: dict[str, float]) -> tuple[tuple[str, float], ...]:
+    """Markers in descending weight, the order scan() checks them in."""
+    return tuple(sorted(markers.items(), key=lambda kv: -kv[1]))
+
+
 class UncertaintyScorer:
+    # Read-only: scan() checks the weight-sorted copy below, derived when the class is
+    # created. Subclasses may replace MARKERS; __init_subclass__ re-derives their order.
     MARKERS: ClassVar[dict[str, float]] = {
         "maybe": 0.2,
         "possibly": 0.2,
@@ -19,15 +26,20 @@ class UncertaintyScorer:
         "i cannot": 0.9,
         "sorry": 0.8,
     }
+    _MARKERS_BY_WEIGHT: ClassVar[tuple[tuple[str, float], ...]] = _by_weight(MARKERS)
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._MARKERS_BY_WEIGHT = _by_weight(cls.MARKERS)
 
-    @staticmethod
-    def scan(text: str) -> float:
+    @classmethod
+    def scan(cls, text: str) -> float:
         """Returns a score from 0.0 (Confident) to 1.0 (Refusal/Unknown)."""
         text_lower = text.lower()
-        max_score = 0.0
 
-        for phrase, weight in UncertaintyScorer.MARKERS.items():
+        # Markers in descending weight: the first hit is the maximum, so stop there
+        for phrase, weight in cls._MARKERS_BY_WEIGHT:
             if phrase in text_lower:
-                max_score = max(max_score, weight)
+                return weight
 
-        return max_score
+        return 0.0
@@ -3,18 +3,12 @@ Integration example: use arctl inside an inference loop.
 Run from project root: python examples/arctl_in_inference_loop.py
 """
 
-import os
-import sys
 from dataclasses import replace
-from typing import Generator, Tuple, List, Optional
+from typing import Generator, List, Optional, Tuple
+
 from arctl.core.kernel import ControllerConfig, SystemState, step
 from arctl.verification.lexical import LexicalMetrics
 
-# --- PATH HACK ---
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 
 def arctl_loop(
     token_stream: List[str],
@@ -35,7 +29,8 @@ def arctl_loop(
         raw = LexicalMetrics.calculate(recent, window=window)
         now += time_step
         state = step(raw, state, now, cfg)
-        temp = state.active_config.temperature if state.active_config else 0.7
+        config = state.active_config
+        temp = config.temperature if config is not None else 0.7
         yield state, temp
 
 
@@ -7,19 +7,12 @@ Shows the core state machine in action.
 Run with: python examples/basic_usage.py
 """
 
-import os
 import sys
 from dataclasses import replace
 
 from arctl.core.kernel import ControllerConfig, SystemState, step
 from arctl.core.states import RawMetrics
 
-# Path hack for running from examples/
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 
 def main() -> None:
     print("=" * 70)
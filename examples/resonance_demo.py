@@ -3,23 +3,11 @@ Resonance Analysis Demo.
 Shows how the system extracts invariant truth across different cognitive modes.
 """
 
-import sys
-from pathlib import Path
+from typing import ClassVar
 
 from arctl.engine.synthesizer import ResonanceSynthesizer
 from arctl.verification.metrics import ResonanceVerifier
 
-# --- PATH SETUP (Robust) ---
-# Get absolute path to the examples directory
-current_dir = Path(__file__).parent
-# Navigate up one level to the project root
-project_root = current_dir.parent
-
-# Add project root to sys.path so Python can find the 'arctl' package
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-# --------------------------
-
 
 class MockModel:
     """
@@ -27,16 +15,20 @@ class MockModel:
     Replace this with your actual API wrapper (OpenAI, Anthropic, Local).
     """
 
+    # Canned response per injected anchor, checked in order; first match wins
+    _ANCHOR_RESPONSES: ClassVar[dict[str, str]] = {
+        "Analytical Clarity": "PWM (Pulse Width Modulation) controls analog circuits via digital signals by varying the duty cycle.",
+        "Creative Exploration": "PWM is like a flickering candle! Digital pulses breathe life into circuits through the rhythm of the duty cycle.",
+        "Critical Vigilance": "WARNING: PWM implementation requires careful EMI filtering. Incorrect duty cycles can damage components.",
+    }
+    _DEFAULT_RESPONSE = "PWM varies pulse width to control power."
+
     def generate(self, prompt: str) -> str:
         # Simulating model responses based on the injected anchor
-        if "Analytical Clarity" in prompt:
-            return "PWM (Pulse Width Modulation) controls analog circuits via digital signals by varying the duty cycle."
-        elif "Creative Exploration" in prompt:
-            return "PWM is like a flickering candle! Digital pulses breathe life into circuits through the rhythm of the duty cycle."
-        elif "Critical Vigilance" in prompt:
-            return "WARNING: PWM implementation requires careful EMI filtering. Incorrect duty cycles can damage components."
-        else:
-            return "PWM varies pulse width to control power."
+        for anchor, response in self._ANCHOR_RESPONSES.items():
+            if anchor in prompt:
+                return response
+        return self._DEFAULT_RESPONSE
 
 
 def main() -> None:
@@ -1,17 +1,10 @@
-import os
-import sys
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.animation import FuncAnimation, PillowWriter
+from matplotlib.animation import PillowWriter
+
 from arctl.core.kernel import ControllerConfig, SystemState, step
 from arctl.core.states import OperationalMode, RawMetrics
 
-# --- PATH HACK ---
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 # --- CONFIG ---
 STEPS = 200
 OUTPUT_FILE = "arctl_phase_space.gif"
@@ -21,13 +14,17 @@ print(f"🚀 INITIALIZING 3D PHASE SPACE SIMULATION ({STEPS} steps)...")
 cfg = ControllerConfig()
 state = SystemState.initial(0.0)
 
-# Data containers
-history: dict = {"rep": [], "energy": [], "temp": [], "mode": []}
+# Data containers: one preallocated block with rows (repetition, energy, temperature), so
+# each row is contiguous and animate() hands views of it to set_data (float32 is ample
+# for plotting values in [0, 10])
+history = np.empty((3, STEPS), dtype=np.float32)
+modes = []
 
 # 2. Simulation Loop
 for t in range(STEPS):
     base_rep = 0.4 + 0.5 * np.sin(t * 0.1)
-    current_temp = state.active_config.temperature if state.active_config else 0.7
+    config = state.active_config
+    current_temp = config.temperature if config is not None else 0.7
     if current_temp > 1.0:
         real_rep = base_rep * 0.2
     else:
@@ -37,10 +34,8 @@ for t in range(STEPS):
     metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=real_rep)
     state = step(metrics, state, float(t), cfg)
 
-    history["rep"].append(real_rep)
-    history["energy"].append(state.energy)
-    history["temp"].append(current_temp)
-    history["mode"].append(state.mode)
+    history[:, t] = real_rep, state.energy, current_temp
+    modes.append(state.mode)
 
 # 3. Visualization Setup
 fig = plt.figure(figsize=(10, 8), facecolor="white")
@@ -56,6 +51,13 @@ ax.set_zlim(0, 1.5)
 (line,) = ax.plot([], [], [], lw=2, color="blue", alpha=0.6)
 (head,) = ax.plot([], [], [], marker="o", markersize=10, color="red")
 
+# Per-frame head style (color, marker size), resolved once instead of inside animate()
+HEAD_STYLE = {
+    OperationalMode.EMERGENCY: ("#ff0000", 15),
+    OperationalMode.COOLDOWN: ("#00ccff", 8),
+}
+head_frames = [HEAD_STYLE.get(m, ("#00ff00", 6)) for m in modes]
+
 
 def init() -> tuple:
     line.set_data([], [])
@@ -66,24 +68,14 @@ def init() -> tuple:
 
 
 def animate(i: int) -> tuple:
-    x = history["rep"][:i]
-    y = history["energy"][:i]
-    z = history["temp"][:i]
-    current_mode = history["mode"][i] if i < len(history["mode"]) else history["mode"][-1]
-
-    if current_mode == OperationalMode.EMERGENCY:
-        head.set_color("#ff0000")
-        head.set_markersize(15)
-    elif current_mode == OperationalMode.COOLDOWN:
-        head.set_color("#00ccff")
-        head.set_markersize(8)
-    else:
-        head.set_color("#00ff00")
-        head.set_markersize(6)
+    x, y, z = history[:, :i]
+    color, size = head_frames[min(i, len(head_frames) - 1)]
+    head.set_color(color)
+    head.set_markersize(size)
 
     line.set_data(x, y)
     line.set_3d_properties(z)
-    if x:
+    if i:
         head.set_data([x[-1]], [y[-1]])
         head.set_3d_properties([z[-1]])
     else:
@@ -95,8 +87,14 @@ def animate(i: int) -> tuple:
 
 
 print(f"🎥 Rendering 3D Animation to {OUTPUT_FILE}...")
-ani = FuncAnimation(fig, animate, init_func=init, frames=STEPS, interval=40, blit=False)
-ani.save(OUTPUT_FILE, writer=PillowWriter(fps=25))
+# Explicit frame loop: FuncAnimation.save() draws every frame twice (once for the
+# animation step, once for the capture); grab_frame() alone draws it once
+writer = PillowWriter(fps=25)
+with writer.saving(fig, OUTPUT_FILE, dpi=fig.dpi):
+    init()
+    for i in range(STEPS):
+        animate(i)
+        writer.grab_frame()
 print("✅ Done.")
 
 if __name__ == "__main__":
@@ -2,17 +2,12 @@
 Simulation experiment: with arctl vs without arctl on a synthetic high-repetition stream.
 
 Produces a reproducible table and summary. No GPU or API required.
-Run from project root: python experiments/simulation_experiment.py
+Run from project root (after `pip install -e .`): python experiments/simulation_experiment.py
 """
 
-import os
 import sys
 from dataclasses import replace
 
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 from arctl.core.kernel import ControllerConfig, SystemState, step
 from arctl.core.states import OperationalMode, RawMetrics
 
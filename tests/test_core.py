@@ -11,10 +11,23 @@ Tests verify:
 """
 
 import unittest
-from dataclasses import replace
-
+from dataclasses import asdict, fields, replace
+from typing import ClassVar
+
+import numpy as np
+
+from arctl.core._kernel_nb import _step_core, flat_config
+from arctl.core.batch import (
+    MODE_CODES,
+    TIME_STATE_CODES,
+    BatchState,
+    SystemStateBuffer,
+    run_trace,
+    step_batch,
+)
 from arctl.core.chronos import (
     LAYERS,
+    Chronos,
     TemporalCoordinateState,
     TimeLayers,
     temporal_state_at,
@@ -25,10 +38,13 @@ from arctl.core.kernel import (
     PolicyConfig,
     SystemState,
     get_diagnostics,
+    get_diagnostics_tuple,
     step,
 )
+from arctl.core.profiles import get_profile, get_profile_view
 from arctl.core.states import OperationalMode, RawMetrics, TimeState
 from arctl.verification.lexical import LexicalMetrics
+from arctl.verification.uncertainty import UncertaintyScorer
 
 
 class TestDiagnostics(unittest.TestCase):
@@ -58,6 +74,14 @@ class TestDiagnostics(unittest.TestCase):
         self.assertGreaterEqual(diag["energy_level"], 0)
         self.assertLessEqual(diag["energy_level"], 10)
 
+    def test_get_diagnostics_tuple_matches_dict(self):
+        """The opt-in tuple carries the same fields, in order, as the dict."""
+        metrics = RawMetrics(entropy=0.5, divergence=0.1, repetition=0.9)
+        state = step(metrics, SystemState.initial(100.0), 3700.0, ControllerConfig())
+        diag = get_diagnostics_tuple(state, 90000.0)
+        self.assertEqual(diag.as_dict(), get_diagnostics(state, 90000.0))
+        self.assertEqual(list(diag._fields), list(get_diagnostics(state, 90000.0)))
+
 
 class TestKernelBasics(unittest.TestCase):
     """Basic kernel functionality tests"""
@@ -87,6 +111,29 @@ class TestKernelBasics(unittest.TestCase):
         self.assertEqual(new_state.active_config, None)
         self.assertAlmostEqual(new_state.pending_dt, 0.001)
 
+    def test_bytes_roundtrip(self):
+        """to_bytes()/from_bytes() preserve every field, including None config and notes"""
+        metrics = RawMetrics(entropy=0.5, divergence=0.1, repetition=0.9)
+        buffered = step(metrics, self.state, 0.001, self.cfg)
+        lagged = step(metrics, self.state, 3600.0, self.cfg)
+        for state in (self.state, buffered, lagged):
+            data = state.to_bytes()
+            self.assertEqual(SystemState.from_bytes(data), state)
+            self.assertEqual(SystemState.from_bytes(memoryview(data)), state)
+        self.assertIsNone(SystemState.from_bytes(buffered.to_bytes()).active_config)
+        self.assertNotEqual(lagged.context_note, "")
+
+    def test_default_config_reuses_derived_fields(self):
+        """ControllerConfig() shares its flattened scalars; custom policies get their own"""
+        self.assertIs(ControllerConfig()._flat, ControllerConfig()._flat)
+        custom = ControllerConfig(policy=PolicyConfig(max_energy=5))
+        self.assertIsNot(custom._flat, ControllerConfig()._flat)
+        self.assertEqual(custom._flat.max_e, 5)
+
+        # The cache is not a dataclass field
+        self.assertEqual([f.name for f in fields(custom)], ["time", "policy"])
+        self.assertEqual(set(asdict(custom)), {"time", "policy"})
+
 
 class TestStateMachine(unittest.TestCase):
     """Tests for state machine transitions"""
@@ -214,15 +261,32 @@ class TestFallbackTerminal(unittest.TestCase):
         metrics_normal = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.2)
         metrics_high = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.9)
 
-        # Try 100 steps with various metrics - mode should never change
+        # Try 100 steps with various metrics - mode should never change.
+        # One comparison over the whole trajectory; the list diff names the first bad step.
         state = fallback_state
+        trajectory = []
         for t in range(100):
             state = step(metrics_high if t % 2 else metrics_normal, state, float(t), self.cfg)
+            trajectory.append((state.mode, state.energy))
+
+        self.assertEqual(trajectory, [(OperationalMode.FALLBACK, 0)] * 100)
+
+    def test_fallback_uses_policy_temperature(self):
+        """Steps taken in FALLBACK sample at the policy's temp_fallback"""
+        cfg = ControllerConfig(policy=PolicyConfig(temp_fallback=0.05))
+        metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.9)
+        fallback = SystemState.initial(0.0)._replace(mode=OperationalMode.FALLBACK, energy=0)
+
+        state = step(metrics, fallback, 1.0, cfg)
+        self.assertEqual(state.mode, OperationalMode.FALLBACK)
+        self.assertEqual(state.active_config.temperature, 0.05)
 
-            self.assertEqual(
-                state.mode, OperationalMode.FALLBACK, f"FALLBACK was exited at step {t}!"
-            )
-            self.assertEqual(state.energy, 0, f"Energy was modified at step {t}!")
+        # Same temperature as the step that entered FALLBACK
+        depleted = SystemState.initial(0.0)._replace(energy=0)
+        fast = ControllerConfig(policy=replace(cfg.policy, smoothing_alpha=1.0))
+        entered = step(metrics, depleted, 1.0, fast)
+        self.assertEqual(entered.mode, OperationalMode.FALLBACK)
+        self.assertEqual(entered.active_config, state.active_config)
 
     def test_fallback_physics_still_updates(self):
         """Even in FALLBACK, physics metrics are updated"""
@@ -344,6 +408,42 @@ class TestLexicalMetrics(unittest.TestCase):
         self.assertGreater(metrics_diverse.entropy, metrics_repetitive.entropy)
 
 
+class TestUncertaintyScorer(unittest.TestCase):
+    """Tests for uncertainty marker scanning"""
+
+    def test_scan_returns_strongest_marker(self):
+        """Score is the highest weight among markers present (case-insensitive)"""
+        self.assertEqual(UncertaintyScorer.scan("The duty cycle is 40%."), 0.0)
+        self.assertEqual(UncertaintyScorer.scan("Maybe it works, I think."), 0.3)
+        self.assertEqual(UncertaintyScorer.scan("Perhaps... Sorry, AS AN AI I cannot"), 0.9)
+
+    def test_subclass_markers_are_scanned(self):
+        """A subclass overriding MARKERS is scanned with its own weights"""
+
+        class StrictScorer(UncertaintyScorer):
+            MARKERS: ClassVar[dict[str, float]] = {"maybe": 0.6, "probably": 0.4}
+
+        self.assertEqual(StrictScorer.scan("Maybe, probably."), 0.6)
+        self.assertEqual(StrictScorer.scan("Sorry."), 0.0)
+        self.assertEqual(UncertaintyScorer.scan("Maybe, probably."), 0.2)
+
+
+class TestProfiles(unittest.TestCase):
+    """Tests for resonance profile lookup"""
+
+    def test_profile_view_is_read_only_and_copy_is_independent(self):
+        """get_profile_view() shares a read-only mapping; get_profile() returns a fresh dict"""
+        view = get_profile_view("technical", "analyze")
+        with self.assertRaises(TypeError):
+            view["calm"] = 0.0  # type: ignore[index]
+
+        profile = get_profile("technical", "analyze")
+        profile["calm"] = 0.0
+        self.assertEqual(get_profile("technical", "analyze"), {"calm": 0.8, "vigilance": 0.2})
+        self.assertEqual(get_profile("technical", "missing"), dict(view))
+        self.assertEqual(get_profile("unknown"), {"calm": 0.8, "wonder": 0.2})
+
+
 class TestChronosTSpiral(unittest.TestCase):
     """Tests for T-SPIRAL_ALIGNMENT semantic anchor (Chronos v1.2)."""
 
@@ -423,6 +523,20 @@ class TestTimeManagement(unittest.TestCase):
         self.assertEqual(new_state.time_state, TimeState.GAP)
         self.assertIn("TEMPORAL SYNC", new_state.context_note)
 
+    def test_sync_fast_matches_sync(self):
+        """Chronos._sync_fast classifies like Chronos.sync, without the note"""
+        for delta in (0.0, 59.9, 60.0, 3600.0, 86399.0, 86400.0, 10 * 86400.0):
+            self.assertIs(Chronos._sync_fast(delta), Chronos.sync(1000.0, 1000.0 + delta)[0])
+
+    def test_context_note_cursor_stamp(self):
+        """Cached minute stamp plus per-call seconds/milliseconds in the note"""
+        _, note = Chronos.sync(0.0, 1700000039.25)
+        self.assertIn("CURSOR (NOW): 2023-11-14 22:13 UTC | layers=2023-11-14 22:13:59.250", note)
+
+        # Sub-microsecond remainder rounds up into the next minute, as datetime does
+        _, note = Chronos.sync(0.0, 1700000039.9999996)
+        self.assertIn("CURSOR (NOW): 2023-11-14 22:14 UTC | layers=2023-11-14 22:14:00.", note)
+
 
 class TestEdgeCases(unittest.TestCase):
     """Tests for edge cases and boundary conditions"""
@@ -472,6 +586,162 @@ class TestEdgeCases(unittest.TestCase):
             # Even with 24h gaps restoring energy, should never exceed max
             self.assertLessEqual(state.energy, self.cfg.policy.max_energy)
 
+    def test_sampling_config_follows_policy(self):
+        """active_config is the policy's interned per-mode SamplingConfig"""
+        cfg = ControllerConfig(policy=PolicyConfig(temp_fallback=0.05))
+        metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.1)
+
+        state = step(metrics, self.state, 1.0, cfg)
+        self.assertIs(state.active_config, cfg.policy.sampling_by_mode[OperationalMode.STANDARD])
+
+        # Derived table is cached outside the dataclass fields
+        self.assertNotIn("sampling_by_mode", asdict(cfg.policy))
+        self.assertIs(
+            PolicyConfig(temp_fallback=0.05).sampling_by_mode[OperationalMode.STANDARD],
+            state.active_config,
+        )
+
+
+class TestBatchKernel(unittest.TestCase):
+    """Tests for the vectorized SoA kernel (step_batch) against scalar step()"""
+
+    def _assert_batch_matches(self, batch, states):
+        for i, expected in enumerate(states):
+            actual = batch.state_at(i)
+            self.assertEqual(actual.mode, expected.mode, f"session {i}")
+            self.assertEqual(actual.energy, expected.energy, f"session {i}")
+            self.assertEqual(actual.time_state, expected.time_state, f"session {i}")
+            self.assertEqual(actual.reset_used, expected.reset_used, f"session {i}")
+            self.assertEqual(actual.step_performed, expected.step_performed, f"session {i}")
+            self.assertEqual(actual.active_config, expected.active_config, f"session {i}")
+            for field in (
+                "s_entropy",
+                "s_divergence",
+                "s_repetition",
+                "last_call_time",
+                "logical_time",
+                "mode_entry_time",
+                "pending_dt",
+            ):
+                self.assertAlmostEqual(
+                    getattr(actual, field), getattr(expected, field), msg=f"{field}[{i}]"
+                )
+
+    def test_initial_roundtrip(self):
+        """BatchState.initial unpacks to SystemState.initial"""
+        batch = BatchState.initial(3, 5.0)
+        self.assertEqual(len(batch), 3)
+        self._assert_batch_matches(batch, [SystemState.initial(5.0)] * 3)
+
+    def test_matches_scalar_step(self):
+        """Each row follows the same trajectory as scalar step()"""
+        cfg = ControllerConfig(policy=PolicyConfig(smoothing_alpha=0.5))
+        base = SystemState.initial(0.0)
+        states = [
+            base,
+            base._replace(energy=2),
+            base._replace(mode=OperationalMode.EMERGENCY, energy=7),
+            base._replace(mode=OperationalMode.COOLDOWN, energy=4),
+            base._replace(mode=OperationalMode.FALLBACK, energy=0),
+            base._replace(energy=3, s_entropy=0.95),
+        ]
+        batch = BatchState.from_states(states)
+        rng = np.random.default_rng(7)
+        now = 0.0
+
+        for t in range(120):
+            # Mix of buffered ticks, regular ticks and one 24h+ gap
+            now += 86400.0 if t == 60 else (0.004 if t % 7 == 0 else 0.1)
+            raw = rng.uniform(0.0, 1.0, size=(len(states), 3))
+            states = [
+                step(RawMetrics(*map(float, row)), s, now, cfg) for row, s in zip(raw, states)
+            ]
+            batch = step_batch(raw, batch, now, cfg)
+
+        self._assert_batch_matches(batch, states)
+
+    def test_anti_stutter_rows(self):
+        """Rows below min_step_interval only buffer pending_dt"""
+        batch = BatchState.initial(2, 0.0)
+        raw = np.full((2, 3), 0.5)
+        new_batch = step_batch(raw, batch, np.array([0.001, 1.0]), ControllerConfig())
+
+        self.assertFalse(new_batch.step_performed[0])
+        self.assertTrue(np.isnan(new_batch.temperature[0]))
+        self.assertAlmostEqual(new_batch.pending_dt[0], 0.001)
+        self.assertTrue(new_batch.step_performed[1])
+
+    def test_run_trace_matches_scalar_step(self):
+        """run_trace row i equals the state after i+1 scalar step() calls"""
+        cfg = ControllerConfig(policy=PolicyConfig(smoothing_alpha=0.5))
+        state = SystemState.initial(0.0)._replace(energy=3)
+        rng = np.random.default_rng(5)
+        raw = rng.uniform(0.0, 1.0, size=(150, 3))
+        deltas = [86400.0 if t == 80 else (0.004 if t % 6 == 0 else 0.1) for t in range(150)]
+        times = np.cumsum(deltas)
+
+        trace = run_trace(raw, times, state, cfg)
+        expected = []
+        for row, now in zip(raw, times):
+            state = step(RawMetrics(*map(float, row)), state, float(now), cfg)
+            expected.append(state)
+
+        self.assertEqual(len(trace), 150)
+        self._assert_batch_matches(trace, expected)
+        with self.assertRaises(ValueError):
+            run_trace(raw[:10], times, state, cfg)
+
+    def test_state_buffer_appends_and_grows(self):
+        """SystemStateBuffer stores appended states as columns past its initial capacity"""
+        cfg = ControllerConfig(policy=PolicyConfig(smoothing_alpha=1.0))
+        metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.9)
+        state = SystemState.initial(0.0)
+        states = [state]
+        for now in (0.001, 1.0, 2.0, 3.0, 50.0, 51.0, 52.0, 200000.0, 200001.0):
+            state = step(metrics, state, now, cfg)
+            states.append(state)
+
+        buf = SystemStateBuffer(capacity=4)
+        for s in states:
+            buf.append(s)
+
+        self.assertEqual(len(buf), len(states))
+        self._assert_batch_matches(buf.columns(), states)
+        self.assertEqual(buf.state_at(-1).mode, states[-1].mode)
+        self.assertEqual(int(buf.columns().energy.sum()), sum(s.energy for s in states))
+        with self.assertRaises(IndexError):
+            buf.state_at(len(states))
+
+
+class TestCompiledCore(unittest.TestCase):
+    """Tests for the flat-scalar kernel core (Numba-compiled when available)"""
+
+    def test_matches_scalar_step(self):
+        """_step_core follows the same trajectory as step()"""
+        cfg = ControllerConfig(policy=PolicyConfig(smoothing_alpha=0.5))
+        flat_cfg = flat_config(cfg)
+        state = SystemState.initial(0.0)._replace(energy=7)
+        core = (0.5, 0.0, 0.0, 0, 7, 0.0, 0.0, 0.0, 0.0, 0, False)
+        rng = np.random.default_rng(11)
+        now = 0.0
+
+        for t in range(200):
+            now += 86400.0 if t == 100 else (0.004 if t % 9 == 0 else 0.1)
+            ent, div, rep = (float(x) for x in rng.uniform(0.0, 1.0, size=3))
+            state = step(RawMetrics(ent, div, rep), state, now, cfg)
+            result = _step_core(*core, ent, div, rep, now, *flat_cfg)
+            core = result[:11]
+
+            self.assertEqual(MODE_CODES[result[3]], state.mode, f"step {t}")
+            self.assertEqual(result[4], state.energy, f"step {t}")
+            self.assertEqual(TIME_STATE_CODES[result[9]], state.time_state, f"step {t}")
+            self.assertEqual(result[10], state.reset_used, f"step {t}")
+            self.assertEqual(result[12], state.step_performed, f"step {t}")
+            self.assertAlmostEqual(result[0], state.s_entropy, msg=f"step {t}")
+            self.assertAlmostEqual(result[2], state.s_repetition, msg=f"step {t}")
+            self.assertAlmostEqual(result[6], state.logical_time, msg=f"step {t}")
+            self.assertAlmostEqual(result[7], state.mode_entry_time, msg=f"step {t}")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,28 +8,64 @@ Tests interaction between:
 - Real-world scenarios
 """
 
+import contextlib
+import io
+import sys
+import threading
 import unittest
 from dataclasses import replace
+from itertools import cycle, islice
+from unittest import mock
+
+import numpy as np
 
 from arctl.core.kernel import ControllerConfig, SystemState, step
 from arctl.core.states import OperationalMode, RawMetrics, TimeState
+from arctl.engine.synthesizer import ResonanceSynthesizer
+from arctl.verification import metrics as verification_metrics
 from arctl.verification.lexical import LexicalMetrics
 from arctl.verification.metrics import ResonanceVerifier
 
+# Shared configs, built once at import and exposed to every kernel test class as
+# self.cfg / self.cfg_fast; ControllerConfig is frozen, so sharing is safe
+_CFG = ControllerConfig()
+_CFG_FAST = ControllerConfig(policy=replace(_CFG.policy, smoothing_alpha=1.0))
+
+# Fixed metric inputs (RawMetrics is frozen), built once at import
+_M_LOW = RawMetrics(entropy=0.6, divergence=0.1, repetition=0.2)
+_M_HIGH = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.8)
+_M_NORMAL = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.3)
+_M_HIGH_REP = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.9)
+_M_LOW_REP = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.1)
+_M_MID = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.5)
+
+
+def _drive(state, metrics, start, dt, n, cfg):
+    """Step n times with the same metrics at start, start + dt, ...; return the last state"""
+    for i in range(n):
+        state = step(metrics, state, start + i * dt, cfg)
+    return state
+
 
 class TestKernelWithLexicalMetrics(unittest.TestCase):
     """Integration test: kernel + lexical metrics"""
 
+    cfg = _CFG
+    cfg_fast = _CFG_FAST
+
+    @classmethod
+    def setUpClass(cls):
+        """Compute the token fixtures once per class"""
+        # Token fixtures and their metrics (frozen RawMetrics, safe to share)
+        cls.repetitive_tokens = ["the", "the", "the", "the", "the"] * 10  # highly repetitive
+        cls.diverse_tokens = [f"w{i}" for i in range(80)]  # unique → low n-gram repetition
+        cls.repetitive_lex = LexicalMetrics.calculate(cls.repetitive_tokens, window=50)
+        cls.diverse_lex = LexicalMetrics.calculate(cls.diverse_tokens, window=50)
+
     def test_repetition_triggers_emergency(self):
         """High lexical repetition should trigger EMERGENCY mode"""
-        cfg = ControllerConfig()
         state = SystemState.initial(0.0)
-
-        # Highly repetitive token sequence
-        repetitive_tokens = ["the", "the", "the", "the", "the"] * 10
-
-        # Calculate metrics from tokens
-        lex_metrics = LexicalMetrics.calculate(repetitive_tokens, window=50)
+        lex_metrics = self.repetitive_lex
 
         # Should have high repetition
         self.assertGreater(lex_metrics.repetition, 0.5)
@@ -41,23 +77,17 @@ class TestKernelWithLexicalMetrics(unittest.TestCase):
             repetition=lex_metrics.repetition,
         )
 
-        # Use fast config for instant updates
-        cfg_fast = ControllerConfig(policy=replace(cfg.policy, smoothing_alpha=1.0))
-
-        # Step with high repetition
-        new_state = step(metrics, state, 1.0, cfg_fast)
+        # Step with high repetition (fast config for instant updates)
+        new_state = step(metrics, state, 1.0, self.cfg_fast)
 
         # Should transition to EMERGENCY
         self.assertEqual(new_state.mode, OperationalMode.EMERGENCY)
 
     def test_diverse_tokens_stay_standard(self):
         """Diverse token sequence (low repetition) should keep system in STANDARD"""
-        cfg = ControllerConfig(policy=replace(ControllerConfig().policy, smoothing_alpha=1.0))
+        cfg = self.cfg_fast
         state = SystemState.initial(0.0)
-
-        # Many unique tokens → low n-gram repetition
-        diverse_tokens = [f"w{i}" for i in range(80)]
-        lex_metrics = LexicalMetrics.calculate(diverse_tokens, window=50)
+        lex_metrics = self.diverse_lex
 
         metrics = RawMetrics(
             entropy=lex_metrics.entropy,
@@ -77,56 +107,46 @@ class TestKernelWithLexicalMetrics(unittest.TestCase):
 class TestFullWorkflow(unittest.TestCase):
     """Integration test: complete workflow"""
 
+    cfg = _CFG
+    cfg_fast = _CFG_FAST
+
     def test_degradation_sequence(self):
         """
         Test realistic degradation sequence:
         STANDARD → repetition rises → EMERGENCY → timeout → COOLDOWN → STANDARD
         """
-        cfg = ControllerConfig(policy=replace(ControllerConfig().policy, smoothing_alpha=1.0))
+        cfg = self.cfg_fast
         state = SystemState.initial(0.0)
-        now = 0.0
-
-        # Phase 1: Normal operation (low repetition)
-        low_rep_metrics = RawMetrics(entropy=0.6, divergence=0.1, repetition=0.2)
-        for i in range(5):
-            state = step(low_rep_metrics, state, now + i * 0.5, cfg)
-
-        self.assertEqual(state.mode, OperationalMode.STANDARD)
-        now = 5 * 0.5
-
-        # Phase 2: Repetition rises - trigger EMERGENCY
-        # With alpha=1.0, instant update, so high rep on first step
-        metrics_high = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.8)
-        state = step(metrics_high, state, now + 1.0, cfg)
-
-        # Should have triggered EMERGENCY by now
-        self.assertEqual(state.mode, OperationalMode.EMERGENCY)
-        emergency_energy = state.energy
-        now = now + 1.0
-
-        # Phase 3: Wait for EMERGENCY timeout (need > 5.0 seconds in mode)
-        # Use loop like test_core to accumulate logical time
-        normal_metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.3)
-        for i in range(55):  # 55 * 0.1 = 5.5 seconds
-            state = step(normal_metrics, state, now + float(i) * 0.1, cfg)
-
-        self.assertEqual(state.mode, OperationalMode.COOLDOWN)
-        now_after_emergency = now + 5.5
 
-        # Phase 4: Wait for COOLDOWN duration (need > 2.0 seconds in mode)
-        for i in range(25):  # 25 * 0.1 = 2.5 seconds
-            state = step(normal_metrics, state, now_after_emergency + float(i) * 0.1, cfg)
+        # (metrics, first step time, dt, steps, expected mode after the phase). Timeout phases
+        # cannot collapse to one step at start + 5.5: each step advances logical time by at
+        # most max_step_interval (0.1 s) and parks the excess in pending_dt.
+        phases = [
+            (_M_LOW, 0.0, 0.5, 5, OperationalMode.STANDARD),  # normal operation (low rep)
+            (_M_HIGH, 3.5, 0.0, 1, OperationalMode.EMERGENCY),  # alpha=1.0: instant high rep
+            (_M_NORMAL, 3.5, 0.1, 55, OperationalMode.COOLDOWN),  # EMERGENCY timeout (> 5.0 s)
+            (_M_NORMAL, 9.0, 0.1, 25, OperationalMode.STANDARD),  # COOLDOWN duration (> 2.0 s)
+        ]
+        energies = []
+        for phase, (metrics, start, dt, n_steps, expected) in enumerate(phases, 1):
+            state = _drive(state, metrics, start, dt, n_steps, cfg)
+            self.assertEqual(state.mode, expected, f"phase {phase}")
+            energies.append(state.energy)
 
-        self.assertEqual(state.mode, OperationalMode.STANDARD)
-        self.assertEqual(state.energy, emergency_energy + 1)  # Recovered 1
+        self.assertEqual(energies[3], energies[1] + 1)  # Recovered 1 since EMERGENCY entry
 
 
 class TestResonanceIntegration(unittest.TestCase):
     """Integration test: kernel + resonance verification"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Load the embedding model (when installed) once for the whole class"""
+        cls.verifier = ResonanceVerifier()
+
     def test_stable_resonance_patterns(self):
         """Verify resonance detector can assess mode consistency"""
-        verifier = ResonanceVerifier()
+        verifier = self.verifier
 
         # Responses that should be similar across modes
         consistent_responses = {
@@ -145,13 +165,108 @@ class TestResonanceIntegration(unittest.TestCase):
         self.assertTrue(result["resonance_score"] >= 0.0)
         self.assertTrue(result["resonance_score"] <= 1.0)
 
+    def test_broken_transformers_install_disables_verification(self):
+        """An installed but unimportable sentence_transformers degrades to embedder=None"""
+        # A None entry in sys.modules makes the import raise ImportError
+        with mock.patch.object(verification_metrics, "HAS_TRANSFORMERS", True):
+            with mock.patch.dict(sys.modules, {"sentence_transformers": None}):
+                with contextlib.redirect_stdout(io.StringIO()) as out:
+                    verifier = ResonanceVerifier()
+        self.assertIsNone(verifier.embedder)
+        self.assertIn("Verification disabled", out.getvalue())
+        self.assertFalse(verifier.verify({"calm": "a", "joy": "b"})["is_stable"])
+
+    def test_pairwise_similarity_matches_reference(self):
+        """Batched cosine similarity equals the per-pair definition (zero rows score 0)"""
+        verifier = ResonanceVerifier.__new__(ResonanceVerifier)  # no embedder needed
+        rng = np.random.default_rng(0)
+        emb1 = rng.normal(size=(3, 8))
+        emb2 = np.vstack([rng.normal(size=(2, 8)), np.zeros((1, 8))])
+
+        expected = []
+        for a in emb1:
+            for b in emb2:
+                na, nb = np.linalg.norm(a), np.linalg.norm(b)
+                expected.append(0.0 if na < 1e-10 or nb < 1e-10 else np.dot(a, b) / (na * nb))
+
+        sim = verifier._calculate_pairwise_similarity(emb1, emb2)
+        self.assertAlmostEqual(sim, float(np.mean(expected)), places=12)
+        self.assertEqual(verifier._calculate_pairwise_similarity(emb1, np.array([])), 0.0)
+
+    def test_verify_with_stub_embedder(self):
+        """verify() on pre-normalized embeddings matches pairwise similarity of raw ones"""
+
+        class StubEmbedder:
+            def __init__(self):
+                self.calls = 0
+
+            def encode(self, claims, convert_to_numpy=True, batch_size=32):
+                self.calls += 1
+                return np.array([[len(c), c.count("e"), c.count(" ") + 1.0] for c in claims])
+
+        verifier = ResonanceVerifier.__new__(ResonanceVerifier)
+        verifier.embedder = StubEmbedder()
+        responses = {
+            "calm": "The sensor reads the voltage. The value is then filtered twice.",
+            "joy": "The sensor happily reads voltage! Then the value gets filtered.",
+            "wonder": "Short.",
+        }
+        result = verifier.verify(responses)
+        self.assertEqual(verifier.embedder.calls, 1)  # all claims in one batch
+
+        raw = {
+            mode: verifier.embedder.encode(verifier._split_into_claims(text))
+            for mode, text in responses.items()
+        }
+        modes = list(raw)
+        expected = [
+            verifier._calculate_pairwise_similarity(raw[modes[i]], raw[modes[j]])
+            for i in range(len(modes))
+            for j in range(i + 1, len(modes))
+        ]
+        self.assertAlmostEqual(result["mean_similarity"], float(np.mean(expected)), places=12)
+        self.assertEqual(result["tested_modes"], modes)
+
+
+class TestMultiSynthesize(unittest.TestCase):
+    """Integration test: multi-pass generation across cognitive modes"""
+
+    class BarrierModel:
+        """Blocks until all four modes are in flight, so it only passes if calls overlap."""
+
+        def __init__(self, parties):
+            self.barrier = threading.Barrier(parties, timeout=5)
+
+        def generate(self, prompt):
+            self.barrier.wait()
+            return prompt.splitlines()[0]
+
+    def test_modes_generate_concurrently(self):
+        """All four per-mode generations overlap; responses stay keyed by mode"""
+        synth = ResonanceSynthesizer(self.BarrierModel(parties=4))
+        result = synth.multi_synthesize("What is PWM?", "technical", max_workers=4)
+
+        self.assertEqual(list(result["responses"]), ["calm", "joy", "vigilance", "wonder"])
+        self.assertEqual(result["responses"]["calm"], "[COGNITIVE MODE: Analytical Clarity]")
+
+    def test_serial_when_single_worker(self):
+        """By default (and with max_workers=1) the model is called sequentially"""
+        synth = ResonanceSynthesizer(self.BarrierModel(parties=1))
+        result = synth.multi_synthesize("What is PWM?", "technical")
+        self.assertEqual(len(result["responses"]), 4)
+        result = synth.multi_synthesize("What is PWM?", "technical", max_workers=1)
+        self.assertEqual(len(result["responses"]), 4)
+
 
 class TestLongRunningBehavior(unittest.TestCase):
     """Integration test: system behavior over extended runs"""
 
+    cfg = _CFG
+    cfg_fast = _CFG_FAST
+
     def test_100_step_stability(self):
         """Verify system remains stable over 100 steps"""
-        cfg = ControllerConfig()
+        cfg = self.cfg
         state = SystemState.initial(0.0)
 
         metrics_cycling = [
@@ -159,45 +274,49 @@ class TestLongRunningBehavior(unittest.TestCase):
             RawMetrics(entropy=0.5, divergence=0.0, repetition=0.8),  # high rep
         ]
 
-        for i in range(100):
-            metrics = metrics_cycling[i % 2]
+        energies = np.empty(100, dtype=np.int64)
+        s_ent = np.empty(100, dtype=np.float64)
+        modes = []
+        for i, metrics in enumerate(islice(cycle(metrics_cycling), 100)):
             state = step(metrics, state, float(i), cfg)
+            energies[i] = state.energy
+            s_ent[i] = state.s_entropy
+            modes.append(state.mode)
 
-            # Invariants
-            self.assertGreaterEqual(state.energy, 0)
-            self.assertLessEqual(state.energy, cfg.policy.max_energy)
-            self.assertTrue(isinstance(state.mode, OperationalMode))
-            self.assertGreaterEqual(state.s_entropy, 0.0)
-            self.assertLessEqual(state.s_entropy, 1.0)
+        # Invariants, checked once over the whole run
+        self.assertTrue(((energies >= 0) & (energies <= cfg.policy.max_energy)).all())
+        self.assertTrue(((s_ent >= 0.0) & (s_ent <= 1.0)).all())
+        self.assertTrue(all(isinstance(mode, OperationalMode) for mode in modes))
 
     def test_energy_depletion_reaches_fallback(self):
         """Over many EMERGENCY transitions, energy depletes to FALLBACK"""
-        cfg = ControllerConfig(policy=replace(ControllerConfig().policy, smoothing_alpha=1.0))
+        cfg = self.cfg_fast
         state = SystemState.initial(0.0)
-        high_rep = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.9)
-        low_rep = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.1)
         emergency_count = 0
-        fallback_reached = False
         now = 0.0
 
-        # Each EMERGENCY needs 55 steps (0.1s each) to timeout; COOLDOWN needs 25 steps
+        # Per-mode drive: (metrics, offset of the first step, steps, seconds per step). The
+        # STANDARD step lands at now + 1.0; each EMERGENCY needs 55 steps (0.1s each, from now)
+        # to timeout; COOLDOWN needs 25 steps. FALLBACK has no entry: it ends the run.
+        phases = {
+            OperationalMode.STANDARD: (_M_HIGH_REP, 1.0, 1, 1.0),
+            OperationalMode.EMERGENCY: (_M_LOW_REP, 0.0, 55, 0.1),
+            OperationalMode.COOLDOWN: (_M_LOW_REP, 0.0, 25, 0.1),
+        }
         for _ in range(20):  # 5+ full cycles to go 10→7→4→1→FALLBACK
-            if state.mode == OperationalMode.FALLBACK:
-                fallback_reached = True
+            phase = phases.get(state.mode)
+            if phase is None:
                 break
-            if state.mode == OperationalMode.STANDARD:
-                state = step(high_rep, state, now + 1.0, cfg)
-                if state.mode == OperationalMode.EMERGENCY:
-                    emergency_count += 1
-                now += 1.0
-            elif state.mode == OperationalMode.EMERGENCY:
-                for i in range(55):
-                    state = step(low_rep, state, now + i * 0.1, cfg)
-                now += 5.5
-            elif state.mode == OperationalMode.COOLDOWN:
-                for i in range(25):
-                    state = step(low_rep, state, now + i * 0.1, cfg)
-                now += 2.5
+            metrics, offset, n_steps, tick = phase
+            prev_mode = state.mode
+            state = _drive(state, metrics, now + offset, tick, n_steps, cfg)
+            now += n_steps * tick
+            if (
+                prev_mode is not OperationalMode.EMERGENCY
+                and state.mode is OperationalMode.EMERGENCY
+            ):
+                emergency_count += 1
+        fallback_reached = state.mode is OperationalMode.FALLBACK
 
         self.assertGreaterEqual(emergency_count, 3, "should trigger at least 3 emergencies")
         self.assertTrue(fallback_reached, "energy depletion must lead to FALLBACK")
@@ -206,15 +325,18 @@ class TestLongRunningBehavior(unittest.TestCase):
 class TestErrorRecovery(unittest.TestCase):
     """Integration test: system behavior with edge cases"""
 
+    cfg = _CFG
+    cfg_fast = _CFG_FAST
+
     def test_rapid_fire_steps(self):
         """System handles rapid-fire step() calls (anti-stutter)"""
-        cfg = ControllerConfig()
+        cfg = self.cfg
         state = SystemState.initial(0.0)
-        metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.5)
+        metrics = _M_MID
 
-        # Call step many times with tiny deltas
-        for _ in range(1000):
-            state = step(metrics, state, state.last_call_time + 0.0001, cfg)
+        # Call step many times with tiny deltas (0.1 ms apart, starting from t=0)
+        for i in range(1, 1001):
+            state = step(metrics, state, i * 0.0001, cfg)
 
         # System should handle this gracefully
         self.assertIsNotNone(state)
@@ -222,9 +344,9 @@ class TestErrorRecovery(unittest.TestCase):
 
     def test_time_gap_handling(self):
         """System properly handles time gaps (24h+ inactivity) — conservative reset (+1 only)"""
-        cfg = ControllerConfig()
+        cfg = self.cfg
         state = SystemState.initial(0.0)._replace(energy=0)
-        metrics = RawMetrics(entropy=0.5, divergence=0.0, repetition=0.1)
+        metrics = _M_LOW_REP
 
         # Zero energy
         self.assertEqual(state.energy, 0)